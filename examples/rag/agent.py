@@ -1,21 +1,40 @@
 from __future__ import annotations
 
-import asyncio
-import json
-from dataclasses import dataclass
-from typing import Any, Optional
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Literal, Optional
 
-from agents import Agent, RunContextWrapper, Runner, function_tool
-from pydantic import BaseModel, ConfigDict
+import orjson
+from agents import Agent, ModelSettings, RunContextWrapper, Runner, function_tool
 from raggify_client import RestAPIClient
 from typing_extensions import TypedDict
 
+from raggify.core import AsyncLoopRunner
+
+from .cached_client import CachedRestAPIClient
 from .logger import logger
+from .persistent_cache import SQLiteQueryCache
+
+try:
+    import uvloop  # type: ignore
+except ImportError:
+    uvloop = None
 
 __all__ = ["AgentExecutionError", "RagAgentManager"]
 
 # Fixed configuration
 _TOPK = 10
+_SRC_KEYS = ("url", "file_path")
+_NL_TABLE = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+# Cap each document sent back to the LLM, since tool output is billed as input
+_MAX_TEXT_CHARS = 1000
+# Upper bound of one agent run, so that a stalled run does not hang the UI
+_RUN_TIMEOUT = 300.0
+
+# Agent runs are dominated by network I/O, so prefer uvloop when available
+_loop_runner = AsyncLoopRunner(
+    loop_factory=uvloop.new_event_loop if uvloop is not None else None
+)
 
 
 class AgentExecutionError(RuntimeError):
@@ -24,280 +43,188 @@ class AgentExecutionError(RuntimeError):
 
 class _TextSearchArgs(TypedDict, total=False):
     query: str
+    modalities: list[Literal["text", "image", "audio", "video"]]
 
 
-class _RagAgentContext(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-    client: RestAPIClient
-    upload_id: Optional[str] = None
+class _UploadSearchArgs(TypedDict, total=False):
+    kinds: list[
+        Literal[
+            "image_image", "audio_audio", "image_video", "audio_video", "video_video"
+        ]
+    ]
 
 
-def _format_documents(payload: dict[str, Any]) -> dict[str, Any]:
-    """Format search documents into a plain dictionary response.
+class _DocumentT(TypedDict, total=False):
+    text: Optional[str]
+    metadata: dict[str, Any]
+    score: float
 
-    Args:
-        payload (dict[str, Any]): Response payload returned from the search API.
 
-    Returns:
-        dict[str, Any]: Summary dictionary per document.
-    """
-    docs = payload.get("documents") or []
-    if not docs:
-        return {"1": "No documents were retrieved."}
+class _SearchPayloadT(TypedDict, total=False):
+    documents: list[_DocumentT]
 
-    summary_dict = {}
-    for idx, doc in enumerate(docs):
-        sub_dict = {}
-        meta = doc.get("metadata") or {}
-        sub_dict["source"] = (
-            meta.get("url") or meta.get("file_path") or meta.get("url") or "unknown"
-        )
-        sub_dict["text"] = doc.get("text", "").strip().replace("\n", " ")
-        sub_dict["score"] = doc.get("score", "")
-        summary_dict[idx] = sub_dict
 
-    return summary_dict
+@dataclass(slots=True)
+class _RagAgentContext:
+    client: CachedRestAPIClient
+    upload_id: Optional[str] = None
+
 
+def _format_documents_json(payload: _SearchPayloadT) -> bytes:
+    """Serialize search documents into columnar JSON.
 
-def _format_response(type: str, query: str, topk: int, payload: dict[str, Any]) -> str:
-    """Summarize search results as a JSON string.
+    Documents are laid out as parallel source, text and score lists, so the
+    field names are written once per search rather than once per document.
 
     Args:
-        type (str): Title describing the result type.
-        query (str): Search query or reference file path.
-        topk (int): Number of retrieved documents.
-        payload (dict[str, Any]): Response payload returned from the search API.
+        payload (_SearchPayloadT): Response payload returned from the search API.
 
     Returns:
-        str: JSON string that summarizes the search results.
+        bytes: JSON object with source, text and score lists.
     """
-    summary = _format_documents(payload)
-    result = json.dumps(
-        {"type": type, "query": query, "topk": topk, "summary": summary},
-        ensure_ascii=False,
-        indent=2,
-    )
-    logger.debug(result)
-
-    return result
-
-
-@function_tool
-async def tool_search_text_text(
-    ctx: RunContextWrapper[_RagAgentContext],
-    args: _TextSearchArgs,
-) -> str:
-    """Search text documents by a text query.
-
-    Args:
-        ctx (RunContextWrapper[_RagAgentContext]): Execution context.
-        args (_TextSearchArgs): Search parameters.
+    docs = payload.get("documents") or []
 
-    Raises:
-        ValueError: Raised when the query string is missing.
+    sources: list[str] = []
+    texts: list[str] = []
+    scores: list[Any] = []
+    for doc in docs:
+        meta = doc.get("metadata") or {}
+        text = doc.get("text") or ""
+        sources.append(next((meta[k] for k in _SRC_KEYS if meta.get(k)), "unknown"))
+        texts.append(text.strip()[:_MAX_TEXT_CHARS].translate(_NL_TABLE))
+        scores.append(doc.get("score", ""))
 
-    Returns:
-        str: JSON string that summarizes the search results.
-    """
-    query = args.get("query")
-    if not query:
-        raise ValueError("query is required")
+    return orjson.dumps({"source": sources, "text": texts, "score": scores})
 
-    response = ctx.context.client.query_text_text(query, _TOPK)
-    return _format_response("text_text", query, _TOPK, response)
 
+def _dump_summary(summary: dict[str, Any]) -> str:
+    """Serialize a search summary for the agent.
 
-@function_tool
-async def tool_search_text_image(
-    ctx: RunContextWrapper[_RagAgentContext],
-    args: _TextSearchArgs,
-) -> str:
-    """Search image documents by a text query.
+    The agent gets compact JSON; the indented form is only built for the debug log.
 
     Args:
-        ctx (RunContextWrapper[_RagAgentContext]): Execution context.
-        args (_TextSearchArgs): Search parameters.
-
-    Raises:
-        ValueError: Raised when the query string is missing.
+        summary (dict[str, Any]): Search summary.
 
     Returns:
-        str: JSON string that summarizes the search results.
+        str: Compact JSON string.
     """
-    query = args.get("query")
-    if not query:
-        raise ValueError("query is required")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(orjson.dumps(summary, option=orjson.OPT_INDENT_2).decode())
 
-    response = ctx.context.client.query_text_image(query, _TOPK)
-    return _format_response("text_image", query, _TOPK, response)
+    return orjson.dumps(summary).decode()
 
 
-@function_tool
-async def tool_search_image_image(ctx: RunContextWrapper[_RagAgentContext]) -> str:
-    """Search image documents based on an uploaded reference image.
+def _format_multi_response(
+    type: str, query: str, topk: int, payload: dict[str, _SearchPayloadT]
+) -> str:
+    """Summarize the results of several searches as a JSON string.
 
     Args:
-        ctx (RunContextWrapper[_RagAgentContext]): Execution context.
-
-    Raises:
-        ValueError: Raised when no reference image is registered.
+        type (str): Title describing the result type.
+        query (str): Search query or reference file path.
+        topk (int): Number of retrieved documents per search.
+        payload (dict[str, _SearchPayloadT]): Response payloads keyed by search.
 
     Returns:
         str: JSON string that summarizes the search results.
     """
-    upload_id = ctx.context.upload_id
-    if not upload_id:
-        raise ValueError("upload_id is not provided in context")
+    summary = {
+        key: orjson.Fragment(_format_documents_json(res))
+        for key, res in payload.items()
+    }
 
-    response = ctx.context.client.query_image_image(upload_id=upload_id, topk=_TOPK)
-    return _format_response("image_image", upload_id, _TOPK, response)
+    return _dump_summary(
+        {"type": type, "query": query, "topk": topk, "summary": summary}
+    )
 
 
 @function_tool
-async def tool_search_text_audio(
+async def tool_search_text_multi(
     ctx: RunContextWrapper[_RagAgentContext],
     args: _TextSearchArgs,
 ) -> str:
-    """Search audio documents by a text query.
+    """Search text, image, audio and/or video documents by a text query at once.
 
     Args:
         ctx (RunContextWrapper[_RagAgentContext]): Execution context.
-        args (_TextSearchArgs): Search parameters.
+        args (_TextSearchArgs): Search parameters. List every modality worth
+            searching in modalities instead of calling the tool once per modality.
 
     Raises:
-        ValueError: Raised when the query string is missing.
+        ValueError: Raised when the query string or modalities are missing.
 
     Returns:
-        str: JSON string that summarizes the search results.
+        str: JSON string that summarizes the search results per modality.
     """
     query = args.get("query")
     if not query:
         raise ValueError("query is required")
 
-    response = ctx.context.client.query_text_audio(query, _TOPK)
-    return _format_response("text_audio", query, _TOPK, response)
+    modalities = args.get("modalities")
+    if not modalities:
+        raise ValueError("modalities is required")
 
-
-@function_tool
-async def tool_search_audio_audio(ctx: RunContextWrapper[_RagAgentContext]) -> str:
-    """Search audio documents based on an uploaded reference audio file.
-
-    Args:
-        ctx (RunContextWrapper[_RagAgentContext]): Execution context.
-
-    Raises:
-        ValueError: Raised when no reference audio is registered.
-
-    Returns:
-        str: JSON string that summarizes the search results.
-    """
-    upload_id = ctx.context.upload_id
-    if not upload_id:
-        raise ValueError("upload_id is not provided in context")
-
-    response = ctx.context.client.query_audio_audio(upload_id=upload_id, topk=_TOPK)
-    return _format_response("audio_audio", upload_id, _TOPK, response)
+    response = await ctx.context.client.aquery_text_multi(query, modalities, _TOPK)
+    return _format_multi_response("text_multi", query, _TOPK, response)
 
 
 @function_tool
-async def tool_search_text_video(
+async def tool_search_by_upload(
     ctx: RunContextWrapper[_RagAgentContext],
-    args: _TextSearchArgs,
+    args: _UploadSearchArgs,
 ) -> str:
-    """Search video documents by a text query.
-
-    Args:
-        ctx (RunContextWrapper[_RagAgentContext]): Execution context.
-        args (_TextSearchArgs): Search parameters.
-
-    Raises:
-        ValueError: Raised when the query string is missing.
-
-    Returns:
-        str: JSON string that summarizes the search results.
-    """
-    query = args.get("query")
-    if not query:
-        raise ValueError("query is required")
-
-    response = ctx.context.client.query_text_video(query, _TOPK)
-    return _format_response("text_video", query, _TOPK, response)
+    """Search documents based on the uploaded reference file, several ways at once.
 
-
-@function_tool
-async def tool_search_image_video(ctx: RunContextWrapper[_RagAgentContext]) -> str:
-    """Search video documents using an uploaded reference image.
+    Kinds are named source_target: image_image finds images similar to a
+    reference image, audio_video finds videos matching a reference audio, etc.
 
     Args:
         ctx (RunContextWrapper[_RagAgentContext]): Execution context.
+        args (_UploadSearchArgs): Search parameters. List every kind worth
+            running in kinds instead of calling the tool once per kind.
 
     Raises:
-        ValueError: Raised when no reference image is registered.
+        ValueError: Raised when no reference file is registered or kinds is missing.
 
     Returns:
-        str: JSON string that summarizes the search results.
+        str: JSON string that summarizes the search results per kind.
     """
     upload_id = ctx.context.upload_id
     if not upload_id:
         raise ValueError("upload_id is not provided in context")
 
-    response = ctx.context.client.query_image_video(upload_id=upload_id, topk=_TOPK)
-    return _format_response("image_video", upload_id, _TOPK, response)
-
-
-@function_tool
-async def tool_search_audio_video(ctx: RunContextWrapper[_RagAgentContext]) -> str:
-    """Search video documents using an uploaded reference audio file.
+    kinds = list(dict.fromkeys(args.get("kinds") or ()))
+    if not kinds:
+        raise ValueError("kinds is required")
 
-    Args:
-        ctx (RunContextWrapper[_RagAgentContext]): Execution context.
-
-    Raises:
-        ValueError: Raised when no reference audio is registered.
-
-    Returns:
-        str: JSON string that summarizes the search results.
-    """
-    upload_id = ctx.context.upload_id
-    if not upload_id:
-        raise ValueError("upload_id is not provided in context")
-
-    response = ctx.context.client.query_audio_video(upload_id=upload_id, topk=_TOPK)
-    return _format_response("audio_video", upload_id, _TOPK, response)
-
-
-@function_tool
-async def tool_search_video_video(ctx: RunContextWrapper[_RagAgentContext]) -> str:
-    """Search video documents using an uploaded reference video file.
-
-    Args:
-        ctx (RunContextWrapper[_RagAgentContext]): Execution context.
-
-    Raises:
-        ValueError: Raised when no reference video is registered.
+    response = await ctx.context.client.aquery_batch(
+        [{"kind": kind, "upload_id": upload_id, "topk": _TOPK} for kind in kinds]
+    )
 
-    Returns:
-        str: JSON string that summarizes the search results.
-    """
-    upload_id = ctx.context.upload_id
-    if not upload_id:
-        raise ValueError("upload_id is not provided in context")
+    return _format_multi_response(
+        "upload_multi", upload_id, _TOPK, dict(zip(kinds, response["results"]))
+    )
 
-    response = ctx.context.client.query_video_video(upload_id=upload_id, topk=_TOPK)
-    return _format_response("video_video", upload_id, _TOPK, response)
 
+_TOOLSET = [tool_search_text_multi, tool_search_by_upload]
+_TOOL_NAMES = [tool.name for tool in _TOOLSET]
 
-_TOOLSET = [
-    tool_search_text_text,
-    tool_search_text_image,
-    tool_search_image_image,
-    tool_search_text_audio,
-    tool_search_audio_audio,
-    tool_search_text_video,
-    tool_search_image_video,
-    tool_search_audio_video,
-    tool_search_video_video,
-]
+_INSTRUCTIONS = (
+    "You are a search agent. "
+    "Always respond to the user in user language. "
+    "Before answering, you MUST use the provided tools to search the knowledge base. "
+    "For a text query, call tool_search_text_multi once and list every modality "
+    "(text, image, audio, video) worth searching in modalities. "
+    "If reference files are available, their upload ids are stored in upload_id. "
+    "To search based on the reference file, call tool_search_by_upload once and "
+    "list every kind (image_image, audio_audio, image_video, audio_video, "
+    "video_video) that fits the file type in kinds. "
+    "Each search result lists source, text and score in parallel arrays, where "
+    "the same index refers to the same document. "
+    "When relevant documents are found, include the file paths in the answer. "
+    "Do not include scores in the answer. "
+    'If no relevant documents are found or an error occurs, reply with "No relevant documents were found." only.'
+)
 
 
 @dataclass(kw_only=True)
@@ -306,6 +233,35 @@ class RagAgentManager:
 
     client: RestAPIClient
     model: str
+    query_cache_path: Optional[str] = None
+    query_cache_ttl: Optional[float] = None
+    _cached_client: CachedRestAPIClient = field(init=False, repr=False)
+    _agent: Agent = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        persistent = None
+        if self.query_cache_path:
+            persistent = SQLiteQueryCache(
+                self.query_cache_path, ttl=self.query_cache_ttl
+            )
+
+        # Keep the query cache alive across runs of the same manager
+        self._cached_client = CachedRestAPIClient(
+            self.client,
+            persistent=persistent,
+            ttl=self.query_cache_ttl,
+        )
+
+        # Tool schemas are derived once here instead of on every run
+        self._agent = Agent(
+            name="rag_assistant",
+            instructions=_INSTRUCTIONS,
+            tools=_TOOLSET,  # type: ignore
+            model=self.model,
+            # Let the model emit the text and reference-file searches in one turn,
+            # which saves an LLM round trip; the server still runs them serially
+            model_settings=ModelSettings(parallel_tool_calls=True),
+        )
 
     def run(
         self,
@@ -331,32 +287,16 @@ class RagAgentManager:
         if question.strip() == "":
             raise ValueError("question must not be empty")
 
-        logger.debug([tool.name for tool in _TOOLSET])
-        agent = Agent(
-            name="rag_assistant",
-            instructions=(
-                "You are a search agent. "
-                "Always respond to the user in user language. "
-                "Before answering, you MUST use the provided tools to search the knowledge base. "
-                "If reference files are available, their upload ids are stored in upload_id. "
-                "Use tools with the upload_id to search based on the reference files. "
-                "When relevant documents are found, include the file paths in the answer. "
-                "Do not include scores in the answer. "
-                'If no relevant documents are found or an error occurs, reply with "No relevant documents were found." only.'
-            ),
-            tools=_TOOLSET,  # type: ignore
-            model=self.model,
-        )
-
-        logger.info(f"upload id = {upload_id}")
+        logger.debug("%s", _TOOL_NAMES)
+        logger.info("upload id = %s", upload_id)
         context = _RagAgentContext(
-            client=self.client,
+            client=self._cached_client,
             upload_id=upload_id,
         )
 
         async def _run() -> str:
             result = await Runner.run(
-                agent,
+                self._agent,
                 input=question,
                 max_turns=max_turns,
                 context=context,
@@ -370,7 +310,9 @@ class RagAgentManager:
             return ""
 
         try:
-            return asyncio.run(_run())
+            # Reuse one background loop so that the loop and the HTTP connection
+            # pools of the agent SDK stay warm across questions
+            return _loop_runner.run(_run, timeout=_RUN_TIMEOUT)
         except Exception as e:
             logger.exception(e)
             raise AgentExecutionError(str(e)) from e
@@ -0,0 +1,347 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Sequence
+
+from raggify_client import RestAPIClient
+
+from .persistent_cache import SQLiteQueryCache
+
+__all__ = ["CachedRestAPIClient", "clear_query_caches"]
+
+_CACHE_SIZE = 1024
+# Live wrappers, so that an ingest can invalidate every one of them
+_instances: weakref.WeakSet[CachedRestAPIClient] = weakref.WeakSet()
+
+
+def _normalize_query(query: str) -> str:
+    """Normalize a query string into its cache key.
+
+    Only runs of whitespace are collapsed, since any other edit may change what
+    the server retrieves.
+
+    Args:
+        query (str): Query string.
+
+    Returns:
+        str: Normalized query string.
+    """
+    return " ".join(query.split())
+
+
+class _TTLMemo:
+    """LRU memo of a function whose entries also expire after a lifetime."""
+
+    def __init__(
+        self, func: Callable[..., Any], maxsize: int, ttl: Optional[float] = None
+    ) -> None:
+        """Constructor.
+
+        Args:
+            func (Callable[..., Any]): Function to memoize by its arguments.
+            maxsize (int): Max number of cached results.
+            ttl (Optional[float], optional): Lifetime of an entry in seconds.
+                Defaults to None (entries never expire).
+        """
+        self._func = func
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        # The async variants call in from worker threads
+        self._lock = threading.Lock()
+
+    def __call__(self, *args: Hashable) -> Any:
+        """Return the cached result for args, calling the function on a miss.
+
+        Returns:
+            Any: Result of the function.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(args)
+            if entry is not None:
+                if self._ttl is None or now - entry[0] <= self._ttl:
+                    self._entries.move_to_end(args)
+                    return entry[1]
+
+                del self._entries[args]
+
+        res = self._func(*args)
+        with self._lock:
+            self._entries[args] = (now, res)
+            self._entries.move_to_end(args)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+        return res
+
+    def cache_clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+
+class CachedRestAPIClient:
+    """RestAPIClient wrapper that memoizes query responses."""
+
+    def __init__(
+        self,
+        client: RestAPIClient,
+        maxsize: int = _CACHE_SIZE,
+        persistent: Optional[SQLiteQueryCache] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            client (RestAPIClient): Wrapped REST API client.
+            maxsize (int, optional): Max number of cached responses.
+                Defaults to _CACHE_SIZE.
+            persistent (Optional[SQLiteQueryCache], optional): Disk cache probed
+                behind the in-memory caches. Defaults to None.
+            ttl (Optional[float], optional): Lifetime of an in-memory entry in
+                seconds. Defaults to None (entries never expire).
+        """
+        self._client = client
+        self._persistent = persistent
+
+        # The cache is bound per instance so that the key only needs
+        # (method, query, topk) and entries die together with the wrapper.
+        self._cached_query = _TTLMemo(self._query, maxsize, ttl)
+        self._cached_query_multi = _TTLMemo(self._query_multi, maxsize, ttl)
+        self._cached_batch = _TTLMemo(self._query_batch, maxsize, ttl)
+        _instances.add(self)
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate non-cached attributes to the wrapped client.
+
+        Args:
+            name (str): Attribute name.
+
+        Returns:
+            Any: Attribute of the wrapped client.
+        """
+        return getattr(self._client, name)
+
+    def _query(self, method: str, query: str, topk: Optional[int]) -> dict[str, Any]:
+        """Dispatch a text query to the wrapped client.
+
+        Args:
+            method (str): Name of the query method on RestAPIClient.
+            query (str): Query string.
+            topk (Optional[int]): Max count.
+
+        Returns:
+            dict[str, Any]: Response data.
+        """
+        return self._disk_query(
+            method,
+            query,
+            topk,
+            lambda: getattr(self._client, method)(query, topk=topk),
+        )
+
+    def _query_multi(
+        self, query: str, modalities: tuple[str, ...], topk: Optional[int]
+    ) -> dict[str, Any]:
+        """Dispatch a text query over several modalities to the wrapped client.
+
+        Args:
+            query (str): Query string.
+            modalities (tuple[str, ...]): Modalities to search.
+            topk (Optional[int]): Max count per modality.
+
+        Returns:
+            dict[str, Any]: Response data keyed by modality.
+        """
+        return self._disk_query(
+            f"query_text_multi:{','.join(modalities)}",
+            query,
+            topk,
+            lambda: self._client.query_text_multi(query, list(modalities), topk=topk),
+        )
+
+    def _query_batch(
+        self, items: tuple[tuple[tuple[str, Any], ...], ...]
+    ) -> dict[str, Any]:
+        """Dispatch a batch of queries to the wrapped client.
+
+        Args:
+            items (tuple[tuple[tuple[str, Any], ...], ...]): Query items frozen
+                into sorted key-value pairs.
+
+        Returns:
+            dict[str, Any]: Response data with one result per item.
+        """
+        return self._client.query_batch([dict(item) for item in items])
+
+    def _disk_query(
+        self,
+        method: str,
+        query: str,
+        topk: Optional[int],
+        fetch: Callable[[], dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Serve a query from the disk cache, falling back to fetch.
+
+        Args:
+            method (str): Cache namespace of the query.
+            query (str): Query string.
+            topk (Optional[int]): Max count.
+            fetch (Callable[[], dict[str, Any]]): Called on a miss.
+
+        Returns:
+            dict[str, Any]: Response data.
+        """
+        if self._persistent is None:
+            return fetch()
+
+        hit = self._persistent.get(method, query, topk)
+        if hit is not None:
+            return hit
+
+        res = fetch()
+        self._persistent.set(method, query, topk, res)
+
+        return res
+
+    def cache_clear(self, persistent: bool = False) -> None:
+        """Drop all cached responses.
+
+        Args:
+            persistent (bool, optional): Whether to also empty the disk cache.
+                Defaults to False.
+        """
+        self._cached_query.cache_clear()
+        self._cached_query_multi.cache_clear()
+        self._cached_batch.cache_clear()
+
+        if persistent and self._persistent is not None:
+            self._persistent.clear()
+
+    def query_batch(self, items: Sequence[dict[str, Any]]) -> dict[str, Any]:
+        """Call the batch query API through the cache.
+
+        Args:
+            items (Sequence[dict[str, Any]]): Query items, each holding the kind
+                and the arguments of that API.
+
+        Returns:
+            dict[str, Any]: Response data with one result per item.
+        """
+        return self._cached_batch(tuple(tuple(sorted(item.items())) for item in items))
+
+    async def aquery_batch(self, items: Sequence[dict[str, Any]]) -> dict[str, Any]:
+        """Call the batch query API through the cache asynchronously.
+
+        Args:
+            items (Sequence[dict[str, Any]]): Query items, each holding the kind
+                and the arguments of that API.
+
+        Returns:
+            dict[str, Any]: Response data with one result per item.
+        """
+        return await asyncio.to_thread(self.query_batch, items)
+
+    def query_text_text(self, query: str, topk: Optional[int] = None) -> dict[str, Any]:
+        """Call the text->text search API through the cache.
+
+        Args:
+            query (str): Query string.
+            topk (Optional[int], optional): Max count. Defaults to None.
+
+        Returns:
+            dict[str, Any]: Response data.
+        """
+        return self._cached_query("query_text_text", _normalize_query(query), topk)
+
+    def query_text_multi(
+        self, query: str, modalities: Sequence[str], topk: Optional[int] = None
+    ) -> dict[str, Any]:
+        """Call the text->multi-modality search API through the cache.
+
+        Args:
+            query (str): Query string.
+            modalities (Sequence[str]): Modalities to search.
+            topk (Optional[int], optional): Max count per modality. Defaults to None.
+
+        Returns:
+            dict[str, Any]: Response data keyed by modality.
+        """
+        # Order and duplicates do not change the response, so normalize the key
+        key = tuple(sorted(set(modalities)))
+
+        return self._cached_query_multi(_normalize_query(query), key, topk)
+
+    async def aquery_text_multi(
+        self, query: str, modalities: Sequence[str], topk: Optional[int] = None
+    ) -> dict[str, Any]:
+        """Call the text->multi-modality search API through the cache asynchronously.
+
+        Args:
+            query (str): Query string.
+            modalities (Sequence[str]): Modalities to search.
+            topk (Optional[int], optional): Max count per modality. Defaults to None.
+
+        Returns:
+            dict[str, Any]: Response data keyed by modality.
+        """
+        return await asyncio.to_thread(
+            self.query_text_multi, query, modalities, topk=topk
+        )
+
+    def query_text_image(
+        self, query: str, topk: Optional[int] = None
+    ) -> dict[str, Any]:
+        """Call the text->image search API through the cache.
+
+        Args:
+            query (str): Query string.
+            topk (Optional[int], optional): Max count. Defaults to None.
+
+        Returns:
+            dict[str, Any]: Response data.
+        """
+        return self._cached_query("query_text_image", _normalize_query(query), topk)
+
+    def query_text_audio(
+        self, query: str, topk: Optional[int] = None
+    ) -> dict[str, Any]:
+        """Call the text->audio search API through the cache.
+
+        Args:
+            query (str): Query string.
+            topk (Optional[int], optional): Max count. Defaults to None.
+
+        Returns:
+            dict[str, Any]: Response data.
+        """
+        return self._cached_query("query_text_audio", _normalize_query(query), topk)
+
+    def query_text_video(
+        self, query: str, topk: Optional[int] = None
+    ) -> dict[str, Any]:
+        """Call the text->video search API through the cache.
+
+        Args:
+            query (str): Query string.
+            topk (Optional[int], optional): Max count. Defaults to None.
+
+        Returns:
+            dict[str, Any]: Response data.
+        """
+        return self._cached_query("query_text_video", _normalize_query(query), topk)
+
+
+def clear_query_caches() -> None:
+    """Drop the cached responses of every live CachedRestAPIClient.
+
+    Call this once the knowledge base has changed, since cached results would
+    otherwise miss the new documents until they expire.
+    """
+    for client in list(_instances):
+        client.cache_clear(persistent=True)
@@ -2,12 +2,34 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import cache
 from typing import Literal, Optional
 
 from dotenv import load_dotenv
 from pydantic import SecretStr
 
-load_dotenv()
+
+@cache
+def _load_env() -> None:
+    """Load the .env file into the environment once per process."""
+    load_dotenv()
+
+
+@cache
+def _openai_api_key() -> Optional[SecretStr]:
+    """Resolve the OpenAI API key on first use.
+
+    Returns:
+        Optional[SecretStr]: API key, or None when it is not set.
+    """
+    _load_env()
+    raw = os.getenv("OPENAI_API_KEY")
+
+    return SecretStr(raw) if raw else None
+
+
+# openai-agents reads OPENAI_API_KEY from the environment by itself
+_load_env()
 
 
 @dataclass(kw_only=True)
@@ -15,6 +37,16 @@ class Config:
     host: str = "localhost"
     port: int = 8000
     openai_llm_model: str = "gpt-4o"
-    _raw = os.getenv("OPENAI_API_KEY")
-    openai_api_key: Optional[SecretStr] = SecretStr(_raw) if _raw else None
+    # Set a file path to keep agent query responses across restarts
+    query_cache_path: Optional[str] = None
+    query_cache_ttl: Optional[float] = 24 * 60 * 60
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "DEBUG"
+
+    @classmethod
+    def openai_api_key(cls) -> Optional[SecretStr]:
+        """Get the OpenAI API key.
+
+        Returns:
+            Optional[SecretStr]: API key, or None when it is not set.
+        """
+        return _openai_api_key()
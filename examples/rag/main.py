@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 import sys
 from pathlib import Path
+from typing import Callable
 
 if __package__ is None or __package__ == "":
     sys.path.append(str(Path(__file__).resolve().parent.parent))
@@ -15,11 +16,34 @@ from .config import Config
 from .logger import logger
 from .state import View, ensure_session_state
 from .views.admin import render_admin_view
+from .views.common import sync_ingest_jobs
 from .views.ingest import render_ingest_view
 from .views.main_menu import render_main_menu
 from .views.ragsearch import render_ragsearch_view
 from .views.search import render_search_view
 
+_VIEW_DISPATCH: dict[View, Callable[[RestAPIClient], None]] = {
+    View.MAIN: render_main_menu,
+    View.INGEST: render_ingest_view,
+    View.SEARCH: render_search_view,
+    View.RAGSEARCH: render_ragsearch_view,
+    View.ADMIN: render_admin_view,
+}
+
+
+@st.cache_resource
+def _get_client(host: str, port: int) -> RestAPIClient:
+    """Create the REST API client once and share it across reruns.
+
+    Args:
+        host (str): Server host.
+        port (int): Server port.
+
+    Returns:
+        RestAPIClient: REST API client.
+    """
+    return RestAPIClient(host=host, port=port)
+
 
 def main() -> None:
     """Entry point for the Streamlit application."""
@@ -27,22 +51,16 @@ def main() -> None:
     st.set_page_config(page_title="RAG System", page_icon="📚", layout="wide")
     ensure_session_state()
 
-    client = RestAPIClient(host=Config.host, port=Config.port)
+    client = _get_client(Config.host, Config.port)
+    sync_ingest_jobs(client)
 
     view = st.session_state.get("view", View.MAIN)
-    match view:
-        case View.MAIN:
-            render_main_menu(client)
-        case View.INGEST:
-            render_ingest_view(client)
-        case View.SEARCH:
-            render_search_view(client)
-        case View.RAGSEARCH:
-            render_ragsearch_view(client)
-        case View.ADMIN:
-            render_admin_view(client)
-        case _:
-            st.error("The requested view is not defined.")
+    renderer = _VIEW_DISPATCH.get(view)
+    if renderer is None:
+        st.error("The requested view is not defined.")
+        return
+
+    renderer(client)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import orjson
+
+__all__ = ["SQLiteQueryCache"]
+
+_MMAP_SIZE = 256 * 1024 * 1024
+
+
+class SQLiteQueryCache:
+    """Disk-backed query response cache shared across restarts and processes."""
+
+    def __init__(self, path: str, ttl: Optional[float] = None) -> None:
+        """Constructor.
+
+        Args:
+            path (str): Path to the SQLite database file.
+            ttl (Optional[float], optional): Lifetime of an entry in seconds.
+                Defaults to None (entries never expire).
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+
+        # WAL lets readers in other processes proceed while one of them writes
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS qcache ("
+            "k BLOB PRIMARY KEY, payload BLOB NOT NULL, ts INTEGER NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _key(method: str, query: str, topk: Optional[int]) -> bytes:
+        """Build the cache key of a query.
+
+        Args:
+            method (str): Query method name.
+            query (str): Query string.
+            topk (Optional[int]): Max count.
+
+        Returns:
+            bytes: 16-byte digest.
+        """
+        return hashlib.blake2b(
+            f"{method}|{query}|{topk}".encode("utf-8"), digest_size=16
+        ).digest()
+
+    def _expired(self, ts: int) -> bool:
+        """Check whether an entry written at ts is past its lifetime.
+
+        Args:
+            ts (int): Write time of the entry.
+
+        Returns:
+            bool: True when the entry is expired.
+        """
+        return self._ttl is not None and time.time() - ts > self._ttl
+
+    def get(
+        self, method: str, query: str, topk: Optional[int]
+    ) -> Optional[dict[str, Any]]:
+        """Look up a cached response.
+
+        Args:
+            method (str): Query method name.
+            query (str): Query string.
+            topk (Optional[int]): Max count.
+
+        Returns:
+            Optional[dict[str, Any]]: Cached response, or None on a miss.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, ts FROM qcache WHERE k = ?",
+                (self._key(method, query, topk),),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        payload, ts = row
+        if self._expired(ts):
+            return None
+
+        return orjson.loads(payload)
+
+    def set(
+        self,
+        method: str,
+        query: str,
+        topk: Optional[int],
+        payload: dict[str, Any],
+    ) -> None:
+        """Store a response.
+
+        Args:
+            method (str): Query method name.
+            query (str): Query string.
+            topk (Optional[int]): Max count.
+            payload (dict[str, Any]): Response to cache.
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO qcache (k, payload, ts) VALUES (?, ?, ?)",
+                (
+                    self._key(method, query, topk),
+                    orjson.dumps(payload),
+                    int(time.time()),
+                ),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._conn.execute("DELETE FROM qcache")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from enum import StrEnum, auto
-from typing import Any, Optional
+from enum import IntEnum, StrEnum, auto
+from typing import Any, Callable, Optional
 
 import streamlit as st
 
@@ -10,6 +10,7 @@ from .logger import logger
 __all__ = [
     "View",
     "FeedBack",
+    "Category",
     "SearchSettings",
     "SearchResult",
     "ensure_session_state",
@@ -22,7 +23,7 @@ __all__ = [
 ]
 
 
-class View(StrEnum):
+class View(IntEnum):
     MAIN = auto()
     INGEST = auto()
     SEARCH = auto()
@@ -45,6 +46,7 @@ class FeedBack(StrEnum):
     FB_SEARCH_IMAGE_VIDEO = auto()
     FB_SEARCH_AUDIO_VIDEO = auto()
     FB_SEARCH_VIDEO_VIDEO = auto()
+    FB_SEARCH_TEXT_ALL = auto()
     # RAG Search
     FB_RAGSEARCH_TEXT_TEXT = auto()
     FB_RAGSEARCH_TEXT_IMAGE = auto()
@@ -56,6 +58,21 @@ class FeedBack(StrEnum):
     FB_ADMIN_PATH_LIST = auto()
 
 
+class Category(StrEnum):
+    SUCCESS = auto()
+    ERROR = auto()
+    WARNING = auto()
+    INFO = auto()
+
+
+_FEEDBACK_RENDERERS: dict[str, Callable[[str], Any]] = {
+    Category.SUCCESS: st.success,
+    Category.ERROR: st.error,
+    Category.WARNING: st.warning,
+    Category.INFO: st.info,
+}
+
+
 class SearchSettings(StrEnum):
     SS_TEXT_RETRIEVE_MODE = auto()
 
@@ -71,6 +88,7 @@ class SearchResult(StrEnum):
     SR_SEARCH_IMAGE_VIDEO = auto()
     SR_SEARCH_AUDIO_VIDEO = auto()
     SR_SEARCH_VIDEO_VIDEO = auto()
+    SR_SEARCH_TEXT_ALL = auto()
     # RAG Search
     SR_RAGSEARCH_TEXT_TEXT = auto()
     SR_RAGSEARCH_TEXT_IMAGE = auto()
@@ -79,37 +97,24 @@ class SearchResult(StrEnum):
     SR_RAGSEARCH_AUDIO_AUDIO = auto()
 
 
+_DEFAULT_KEYS = tuple(FeedBack) + tuple(SearchSettings) + tuple(SearchResult)
+
+
 def ensure_session_state() -> None:
     """Initialize the Streamlit session state."""
 
-    _DEFAULT_STATUS_TEXT = "Unknown"
     current_view = st.session_state.get("view")
     if current_view is None:
         st.session_state["view"] = View.MAIN
     elif not isinstance(current_view, View):
         try:
-            st.session_state["view"] = View[str(current_view).upper()]
-        except KeyError:
+            st.session_state["view"] = View(int(current_view))
+        except (TypeError, ValueError):
             st.session_state["view"] = View.MAIN
 
-    if "status_texts" not in st.session_state:
-        st.session_state["status_texts"] = {
-            "raggify": _DEFAULT_STATUS_TEXT,
-            "embed": _DEFAULT_STATUS_TEXT,
-            "rerank": _DEFAULT_STATUS_TEXT,
-        }
-
-    if "status_dirty" not in st.session_state:
-        st.session_state["status_dirty"] = True
-
-    for key in FeedBack:
-        st.session_state.setdefault(key, None)
-
-    for key in SearchSettings:
-        st.session_state.setdefault(key, None)
-
-    for key in SearchResult:
-        st.session_state.setdefault(key, None)
+    missing = {key: None for key in _DEFAULT_KEYS if key not in st.session_state}
+    if missing:
+        st.session_state.update(missing)
 
 
 def set_view(view: View) -> None:
@@ -119,19 +124,17 @@ def set_view(view: View) -> None:
         view (View): Destination view identifier.
     """
     st.session_state["view"] = view
-    if view == View.MAIN:
-        st.session_state["status_dirty"] = True
 
 
-def set_feedback(key: FeedBack | str, category: str, message: str) -> None:
+def set_feedback(key: FeedBack | str, category: Category | str, message: str) -> None:
     """Store a feedback message in the session.
 
     Args:
         key (FeedBack | str): Session state key.
-        category (str): Message category.
+        category (Category | str): Message category.
         message (str): Message text.
     """
-    st.session_state[key] = {"category": category, "message": message}
+    st.session_state[key] = (category, message)
 
 
 def clear_feedback(key: FeedBack | str) -> None:
@@ -153,19 +156,14 @@ def display_feedback(key: FeedBack | str) -> None:
     if not payload:
         return
 
-    category = payload.get("category", "")
-    message = payload.get("message", "")
-
-    if category == "success":
-        st.success(message)
-    elif category == "error":
-        st.error(message)
-    elif category == "warning":
-        st.warning(message)
-    elif category == "info":
-        st.info(message)
-    else:
+    category, message = payload
+
+    renderer = _FEEDBACK_RENDERERS.get(category)
+    if renderer is None:
         logger.warning(f"undefined category: {category}")
+        return
+
+    renderer(message)
 
 
 def set_search_result(
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import streamlit as st
-from raggify_client import RestAPIClient
 
 from ..logger import logger
 from ..state import (
+    Category,
     FeedBack,
     View,
     clear_feedback,
@@ -14,7 +14,10 @@ from ..state import (
     set_feedback,
     set_view,
 )
-from .common import save_uploaded_files
+from .common import save_uploaded_files, track_ingest_job
+
+if TYPE_CHECKING:
+    from raggify_client import RestAPIClient
 
 __all__ = [
     "register_local_path_callback",
@@ -36,17 +39,17 @@ def register_local_path_callback(
     clear_feedback(feedback_key)
     path = (path_value or "").strip()
     if not path:
-        set_feedback(feedback_key, "warning", "Enter a path.")
+        set_feedback(feedback_key, Category.WARNING, "Enter a path.")
         return
 
     try:
         with st.spinner("Registering path..."):
-            client.ingest_path(path)
+            track_ingest_job(client.ingest_path(path))
     except Exception as e:
         logger.exception(e)
-        set_feedback(feedback_key, "error", f"Failed to register path: {e}")
+        set_feedback(feedback_key, Category.ERROR, f"Failed to register path: {e}")
     else:
-        set_feedback(feedback_key, "success", "Path registration completed.")
+        set_feedback(feedback_key, Category.SUCCESS, "Path registration completed.")
 
 
 def register_path_list_callback(
@@ -63,18 +66,20 @@ def register_path_list_callback(
     """
     clear_feedback(feedback_key)
     if file_obj is None:
-        set_feedback(feedback_key, "warning", "No path list selected.")
+        set_feedback(feedback_key, Category.WARNING, "No path list selected.")
         return
 
     try:
         with st.spinner("Registering path list..."):
             upload_id = save_uploaded_files(client, [file_obj])[0]
-            client.ingest_path_list(upload_id=upload_id)
+            track_ingest_job(client.ingest_path_list(upload_id=upload_id))
     except Exception as e:
         logger.exception(e)
-        set_feedback(feedback_key, "error", f"Failed to register path list: {e}")
+        set_feedback(feedback_key, Category.ERROR, f"Failed to register path list: {e}")
     else:
-        set_feedback(feedback_key, "success", "Path list registration completed.")
+        set_feedback(
+            feedback_key, Category.SUCCESS, "Path list registration completed."
+        )
 
 
 def render_admin_view(client: RestAPIClient) -> None:
@@ -1,10 +1,31 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+import hashlib
+from operator import itemgetter
+from typing import IO, TYPE_CHECKING, Any, Optional
 
-from raggify_client import RestAPIClient
+import streamlit as st
 
-__all__ = ["emojify_robot", "save_uploaded_files"]
+from ..logger import logger
+
+if TYPE_CHECKING:
+    from raggify_client import RestAPIClient
+
+__all__ = [
+    "emojify_robot",
+    "known_upload_ids",
+    "save_uploaded_files",
+    "sync_ingest_jobs",
+    "track_ingest_job",
+    "upload_digest",
+]
+
+_get_upload_id = itemgetter("upload_id")
+_UPLOAD_IDS_KEY = "upload_ids_by_digest"
+_PENDING_JOBS_KEY = "pending_ingest_jobs"
+# Job states after which an ingest no longer changes the knowledge base
+_DONE_JOB_STATUSES = frozenset({"succeeded", "failed"})
+_EMOJI_TABLE = str.maketrans({"\U0001f916": "\U0001f916\ufe0f"})  # 🤖
 
 
 def emojify_robot(s: str) -> str:
@@ -17,15 +38,46 @@ def emojify_robot(s: str) -> str:
     Returns:
         str: Updated string with proper emoji presentation.
     """
-    return s.replace("\U0001f916", "\U0001f916" + "\ufe0f")  # 🤖
+    return s.translate(_EMOJI_TABLE)
+
+
+def upload_digest(file_obj: Any) -> str:
+    """Hash the content of an uploaded file.
+
+    Args:
+        file_obj (Any): Uploaded file object from Streamlit.
+
+    Returns:
+        str: SHA-256 hex digest.
+    """
+    # file_digest reads the in-memory buffer of UploadedFile without a copy
+    file_obj.seek(0)
+    digest = hashlib.file_digest(file_obj, "sha256").hexdigest()
+    file_obj.seek(0)
+
+    return digest
 
 
-def save_uploaded_files(client: RestAPIClient, files: list[Any]) -> list[str]:
+def known_upload_ids() -> dict[str, str]:
+    """Get the upload ids of this session keyed by content digest.
+
+    Returns:
+        dict[str, str]: Upload ids keyed by upload_digest.
+    """
+    return st.session_state.setdefault(_UPLOAD_IDS_KEY, {})
+
+
+def save_uploaded_files(
+    client: RestAPIClient, files: list[Any], reuse: bool = False
+) -> list[str]:
     """Persist uploaded files and return their upload ids on raggify.
 
     Args:
         client (RestAPIClient): REST API client.
         files (list[Any]): Uploaded file objects from Streamlit.
+        reuse (bool, optional): Skip files whose content was already uploaded in
+            this session and return the earlier upload id, as long as the server
+            still knows it. Defaults to False.
 
     Returns:
         list[str]: List of upload identifiers.
@@ -33,10 +85,95 @@ def save_uploaded_files(client: RestAPIClient, files: list[Any]) -> list[str]:
     Raises:
         RuntimeError: Raised when the response payload is invalid.
     """
-    payload: list[tuple[str, bytes, Optional[str]]] = []
+    if not reuse:
+        return _upload_files(client, files)
+
+    known = known_upload_ids()
+    digests = [upload_digest(uploaded) for uploaded in files]
+    for digest in set(digests) & known.keys():
+        # Upload ids die with the server process, so drop the stale ones
+        if not client.upload_status(known[digest]).get("exists"):
+            known.pop(digest)
+
+    missing = [i for i, digest in enumerate(digests) if digest not in known]
+    if missing:
+        fresh = _upload_files(client, [files[i] for i in missing])
+        for i, upload_id in zip(missing, fresh):
+            known[digests[i]] = upload_id
+
+    return [known[digest] for digest in digests]
+
+
+def track_ingest_job(response: dict[str, Any]) -> None:
+    """Remember an accepted ingest job until sync_ingest_jobs sees it finish.
+
+    Args:
+        response (dict[str, Any]): Response of an ingest API.
+    """
+    job_id = response.get("job_id")
+    if job_id:
+        st.session_state.setdefault(_PENDING_JOBS_KEY, set()).add(job_id)
+
+
+def sync_ingest_jobs(client: RestAPIClient) -> None:
+    """Drop every cached query result once a tracked ingest job has finished.
+
+    Cached results would otherwise miss the new documents until they expire.
+
+    Args:
+        client (RestAPIClient): REST API client.
+    """
+    pending: Optional[set[str]] = st.session_state.get(_PENDING_JOBS_KEY)
+    if not pending:
+        return
+
+    done = set()
+    for job_id in pending:
+        try:
+            status = client.job(job_id).get("status")
+        except Exception as e:
+            # The job is gone (removed or the server restarted), so stop waiting
+            logger.warning(f"failed to get status of job {job_id}: {e}")
+            status = None
+
+        if status is None or status in _DONE_JOB_STATUSES:
+            done.add(job_id)
+
+    if not done:
+        return
+
+    pending -= done
+    _clear_query_caches()
+
+
+def _clear_query_caches() -> None:
+    """Drop the cached results of the search view and of the agent."""
+    # Imported here so that the agent cache tiers are not loaded at app start
+    from ..cached_client import clear_query_caches
+    from .search import clear_search_caches
+
+    clear_search_caches()
+    clear_query_caches()
+
+
+def _upload_files(client: RestAPIClient, files: list[Any]) -> list[str]:
+    """Upload files to raggify.
+
+    Args:
+        client (RestAPIClient): REST API client.
+        files (list[Any]): Uploaded file objects from Streamlit.
+
+    Returns:
+        list[str]: List of upload identifiers.
+
+    Raises:
+        RuntimeError: Raised when the response payload is invalid.
+    """
+    payload: list[tuple[str, IO[bytes], Optional[str]]] = []
     for uploaded in files:
-        data = uploaded.getvalue()
-        payload.append((uploaded.name, data, getattr(uploaded, "type", None)))
+        # Hand the file object over as is so that its content is not copied
+        uploaded.seek(0)
+        payload.append((uploaded.name, uploaded, getattr(uploaded, "type", None)))
 
     if not payload:
         return []
@@ -46,14 +183,16 @@ def save_uploaded_files(client: RestAPIClient, files: list[Any]) -> list[str]:
     if not isinstance(entries, list):
         raise RuntimeError("raggify upload response is invalid")
 
-    upload_ids: list[str] = []
-    for item in entries:
-        if not isinstance(item, dict):
-            raise RuntimeError("raggify upload response item is invalid")
-        upload_id = item.get("upload_id")
-        if not isinstance(upload_id, str) or upload_id == "":
-            raise RuntimeError("raggify upload_id is invalid")
-        upload_ids.append(upload_id)
+    if not all(isinstance(item, dict) for item in entries):
+        raise RuntimeError("raggify upload response item is invalid")
+
+    try:
+        upload_ids: list[str] = [_get_upload_id(item) for item in entries]
+    except KeyError as e:
+        raise RuntimeError("raggify upload_id is invalid") from e
+
+    if not all(isinstance(upload_id, str) and upload_id for upload_id in upload_ids):
+        raise RuntimeError("raggify upload_id is invalid")
 
     if len(upload_ids) != len(payload):
         raise RuntimeError("raggify upload file count mismatch")
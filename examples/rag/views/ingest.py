@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import streamlit as st
-from raggify_client import RestAPIClient
 
 from ..logger import logger
 from ..state import (
+    Category,
     FeedBack,
     View,
     clear_feedback,
@@ -14,7 +14,10 @@ from ..state import (
     set_feedback,
     set_view,
 )
-from .common import save_uploaded_files
+from .common import save_uploaded_files, track_ingest_job
+
+if TYPE_CHECKING:
+    from raggify_client import RestAPIClient
 
 __all__ = [
     "register_uploaded_files_callback",
@@ -38,19 +41,18 @@ def register_uploaded_files_callback(
     """
     clear_feedback(feedback_key)
     if not files:
-        set_feedback(feedback_key, "warning", "No files uploaded.")
+        set_feedback(feedback_key, Category.WARNING, "No files uploaded.")
         return
 
     try:
         with st.spinner("Registering files..."):
             upload_ids = save_uploaded_files(client, files)
-            for upload_id in upload_ids:
-                client.ingest_path(upload_id=upload_id)
+            track_ingest_job(client.ingest_paths(upload_ids=upload_ids))
     except Exception as e:
         logger.exception(e)
-        set_feedback(feedback_key, "error", f"Failed to register files: {e}")
+        set_feedback(feedback_key, Category.ERROR, f"Failed to register files: {e}")
     else:
-        set_feedback(feedback_key, "success", "File registration completed.")
+        set_feedback(feedback_key, Category.SUCCESS, "File registration completed.")
 
 
 def register_url_callback(
@@ -66,17 +68,17 @@ def register_url_callback(
     clear_feedback(feedback_key)
     url = (url_value or "").strip()
     if not url:
-        set_feedback(feedback_key, "warning", "Enter a URL.")
+        set_feedback(feedback_key, Category.WARNING, "Enter a URL.")
         return
 
     try:
         with st.spinner("Registering URL..."):
-            client.ingest_url(url)
+            track_ingest_job(client.ingest_url(url))
     except Exception as e:
         logger.exception(e)
-        set_feedback(feedback_key, "error", f"Failed to register URL: {e}")
+        set_feedback(feedback_key, Category.ERROR, f"Failed to register URL: {e}")
     else:
-        set_feedback(feedback_key, "success", "URL registration completed.")
+        set_feedback(feedback_key, Category.SUCCESS, "URL registration completed.")
 
 
 def register_url_list_callback(
@@ -93,18 +95,18 @@ def register_url_list_callback(
     """
     clear_feedback(feedback_key)
     if file_obj is None:
-        set_feedback(feedback_key, "warning", "No URL list selected.")
+        set_feedback(feedback_key, Category.WARNING, "No URL list selected.")
         return
 
     try:
         with st.spinner("Registering URL list..."):
             upload_id = save_uploaded_files(client, [file_obj])[0]
-            client.ingest_url_list(upload_id=upload_id)
+            track_ingest_job(client.ingest_url_list(upload_id=upload_id))
     except Exception as e:
         logger.exception(e)
-        set_feedback(feedback_key, "error", f"Failed to register URL list: {e}")
+        set_feedback(feedback_key, Category.ERROR, f"Failed to register URL list: {e}")
     else:
-        set_feedback(feedback_key, "success", "URL list registration completed.")
+        set_feedback(feedback_key, Category.SUCCESS, "URL list registration completed.")
 
 
 def render_ingest_view(client: RestAPIClient) -> None:
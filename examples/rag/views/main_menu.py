@@ -1,63 +1,66 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import streamlit as st
-from raggify_client import RestAPIClient
 
 from ..logger import logger
 from ..state import View, set_view
 from .common import emojify_robot
 
+if TYPE_CHECKING:
+    from raggify_client import RestAPIClient
+
 __all__ = ["render_main_menu"]
 
+_STATUS_TTL = 15
+_DEFAULT_STATUS_TEXT = "Unknown"
+_STATUS_KEYS = ("vector store", "embed", "rerank", "document store", "ingest cache")
+_RAG_SEARCH_LABEL = emojify_robot("🤖 Go to RAG search")
+_MENU = (
+    ("📝 Go to ingestion", View.INGEST),
+    ("🔍 Go to DB search", View.SEARCH),
+    (_RAG_SEARCH_LABEL, View.RAGSEARCH),
+    ("🛠️ Go to admin menu", View.ADMIN),
+)
+
 
-def _summarize_status(
-    server_stat: dict[str, Any],
-) -> dict[str, str]:
+def _summarize_status(server_stat: dict[str, Any]) -> str:
     """Summarize server status into display text.
 
     Args:
         server_stat (dict[str, Any]): server status payload.
 
     Returns:
-        dict[str, str]: Service status description.
+        str: Service status description.
     """
+    if server_stat.get("status") != "ok":
+        return "🛑 Offline"
+
     details = "\n".join(
-        [
-            f"- vector store: {server_stat.get('vector store', 'N/A')}",
-            f"- embed: {server_stat.get('embed', 'N/A')}",
-            f"- rerank: {server_stat.get('rerank', 'N/A')}",
-            f"- document store: {server_stat.get('document store', 'N/A')}",
-            f"- ingest cache: {server_stat.get('ingest cache', 'N/A')}",
-        ]
+        f"- {key}: {server_stat.get(key, 'N/A')}" for key in _STATUS_KEYS
     )
 
-    return {
-        "raggify": (
-            f"✅ Online\n{details}"
-            if server_stat.get("status") == "ok"
-            else "🛑 Offline"
-        )
-    }
+    return f"✅ Online\n{details}"
 
 
-def _refresh_status(client: RestAPIClient) -> None:
-    """Refresh service status and store it in the session state.
+@st.cache_data(ttl=_STATUS_TTL, show_spinner=False)
+def _fetch_status_markdown(base_url: str, _client: RestAPIClient) -> str:
+    """Fetch the server status as markdown, shared across reruns for _STATUS_TTL.
+
+    Failures propagate so that only successful probes are cached.
 
     Args:
-        client (RestAPIClient): REST API client.
-    """
-    try:
-        server_stat = client.status()
-        texts = _summarize_status(server_stat)
-        st.session_state["status_texts"] = texts
-        st.session_state["status_dirty"] = False
-    except Exception:
-        logger.warning("raggify is not ready")
+        base_url (str): Server base URL, used as the cache key.
+        _client (RestAPIClient): REST API client (excluded from the cache key).
 
-        _DEFAULT_STATUS_TEXT = "Unknown"
-        st.session_state["status_texts"] = {"raggify": _DEFAULT_STATUS_TEXT}
+    Raises:
+        RuntimeError: If the status request fails.
+
+    Returns:
+        str: Status markdown.
+    """
+    return f"RAG server:\n{_summarize_status(_client.status())}"
 
 
 def _render_status_section(client: RestAPIClient) -> None:
@@ -66,17 +69,15 @@ def _render_status_section(client: RestAPIClient) -> None:
     Args:
         client (RestAPIClient): REST API client.
     """
-    if st.session_state.get("status_dirty", False):
-        _refresh_status(client)
-
     st.subheader("🩺 Service status")
-    texts = st.session_state["status_texts"]
-    st.markdown(f"RAG server:\n{texts['raggify']}")
-    st.button(
-        "🔄 Refresh status",
-        on_click=_refresh_status,
-        args=(client,),
-    )
+    try:
+        text = _fetch_status_markdown(client.base_url, client)
+    except Exception:
+        logger.warning("raggify is not ready")
+        text = f"RAG server:\n{_DEFAULT_STATUS_TEXT}"
+
+    st.markdown(text)
+    st.button("🔄 Refresh status", on_click=_fetch_status_markdown.clear)
 
 
 def render_main_menu(client: RestAPIClient) -> None:
@@ -89,9 +90,5 @@ def render_main_menu(client: RestAPIClient) -> None:
     _render_status_section(client)
 
     st.subheader("🧭 Menu")
-    st.button("📝 Go to ingestion", on_click=set_view, args=(View.INGEST,))
-    st.button("🔍 Go to DB search", on_click=set_view, args=(View.SEARCH,))
-    st.button(
-        emojify_robot("🤖 Go to RAG search"), on_click=set_view, args=(View.RAGSEARCH,)
-    )
-    st.button("🛠️ Go to admin menu", on_click=set_view, args=(View.ADMIN,))
+    for label, view in _MENU:
+        st.button(label, on_click=set_view, args=(view,))
@@ -1,20 +1,28 @@
 from __future__ import annotations
 
 from enum import StrEnum, auto
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import streamlit as st
-from raggify_client import RestAPIClient
 
 from raggify.core import Exts
 
-from ..agent import AgentExecutionError, RagAgentManager
 from ..config import Config
 from ..state import View, set_view
 from .common import emojify_robot, save_uploaded_files
 
+if TYPE_CHECKING:
+    from raggify_client import RestAPIClient
+
+    from ..agent import RagAgentManager
+
 __all__ = ["render_ragsearch_view"]
 
+# Built once per process instead of on every Streamlit rerun
+_REF_FILE_EXTS: list[str] = sorted(Exts.IMAGE | Exts.AUDIO | Exts.VIDEO)
+_TITLE = emojify_robot("🤖 RAG Search")
+_SUBMIT = emojify_robot("🤖 Submit")
+
 
 class RagSearchSessionKey(StrEnum):
     ANSWER = auto()
@@ -22,6 +30,36 @@ class RagSearchSessionKey(StrEnum):
     AUDIO_PATH = auto()
 
 
+@st.cache_resource(show_spinner=False)
+def _get_rag_manager(
+    base_url: str,
+    model: str,
+    query_cache_path: Optional[str],
+    query_cache_ttl: Optional[float],
+    _client: RestAPIClient,
+) -> RagAgentManager:
+    """Create the RAG agent manager once and share it across reruns.
+
+    Args:
+        base_url (str): Server base URL, used as part of the cache key.
+        model (str): LLM model name.
+        query_cache_path (Optional[str]): Path of the persistent query cache.
+        query_cache_ttl (Optional[float]): Lifetime of a query cache entry.
+        _client (RestAPIClient): REST API client (excluded from the cache key).
+
+    Returns:
+        RagAgentManager: Agent manager.
+    """
+    from ..agent import RagAgentManager
+
+    return RagAgentManager(
+        client=_client,
+        model=model,
+        query_cache_path=query_cache_path,
+        query_cache_ttl=query_cache_ttl,
+    )
+
+
 def _save_reference_file(
     client: RestAPIClient,
     file_obj: Optional[Any],
@@ -45,8 +83,11 @@ def _save_reference_file(
         return None
 
     try:
-        saved = save_uploaded_files(client, [file_obj])
+        # Resubmitting with the same attachment reuses the earlier upload
+        saved = save_uploaded_files(client, [file_obj], reuse=True)
     except Exception as e:
+        from ..agent import AgentExecutionError
+
         st.session_state[session_key] = None
         raise AgentExecutionError(f"failed to upload reference file: {e}") from e
 
@@ -61,7 +102,7 @@ def render_ragsearch_view(client: RestAPIClient) -> None:
     Args:
         client (RestAPIClient): REST API client.
     """
-    st.title(emojify_robot("🤖 RAG Search"))
+    st.title(_TITLE)
     st.button(
         "⬅️ Back to menu", key="ragsearch_back", on_click=set_view, args=(View.MAIN,)
     )
@@ -71,17 +112,17 @@ def render_ragsearch_view(client: RestAPIClient) -> None:
 
     ref_file = st.file_uploader(
         "Attachment (optional)",
-        type=list(Exts.IMAGE | Exts.AUDIO | Exts.VIDEO),
+        type=_REF_FILE_EXTS,
         key="ragsearch_image",
     )
 
-    if RagSearchSessionKey.ANSWER not in st.session_state:
-        st.session_state[RagSearchSessionKey.ANSWER] = None
-
-    if st.button(emojify_robot("🤖 Submit"), key="ragsearch_submit"):
+    if st.button(_SUBMIT, key="ragsearch_submit"):
         if not question.strip():
             st.warning("Enter a question.")
         else:
+            # The agent SDK is loaded on the first submit, not at app start
+            from ..agent import AgentExecutionError
+
             upload_id = None
             try:
                 upload_id = _save_reference_file(
@@ -91,7 +132,13 @@ def render_ragsearch_view(client: RestAPIClient) -> None:
                 st.error(str(e))
                 st.session_state[RagSearchSessionKey.ANSWER] = None
             else:
-                manager = RagAgentManager(client=client, model=Config.openai_llm_model)
+                manager = _get_rag_manager(
+                    client.base_url,
+                    Config.openai_llm_model,
+                    Config.query_cache_path,
+                    Config.query_cache_ttl,
+                    client,
+                )
                 try:
                     with st.spinner("Running RAG search..."):
                         answer = manager.run(
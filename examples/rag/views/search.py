@@ -1,15 +1,20 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Literal, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Literal, Mapping, Optional
 
 import streamlit as st
-from raggify_client import RestAPIClient
+from streamlit.errors import StreamlitAPIException
+from streamlit.runtime.media_file_storage import MediaFileStorageError
 
 from raggify.config.retrieve_config import RetrieveMode
 from raggify.core import Exts
 
 from ..logger import logger
 from ..state import (
+    Category,
     FeedBack,
     SearchResult,
     SearchSettings,
@@ -21,7 +26,10 @@ from ..state import (
     set_search_result,
     set_view,
 )
-from .common import save_uploaded_files
+from .common import known_upload_ids, sync_ingest_jobs, upload_digest
+
+if TYPE_CHECKING:
+    from raggify_client import RestAPIClient
 
 __all__ = [
     "run_text_text_search_callback",
@@ -33,299 +41,162 @@ __all__ = [
     "run_image_video_search_callback",
     "run_audio_video_search_callback",
     "run_video_video_search_callback",
+    "run_text_all_search_callback",
+    "clear_search_caches",
     "render_search_view",
 ]
 
+_QUERY_TTL = 300
 
-def _render_search_section(
-    *,
-    title: str,
-    caption: str,
-    input_func: Callable[[], Any],
-    button_label: str,
-    button_callback: Callable[..., None],
-    button_args: Callable[[Any], tuple],
-    feedback_key: FeedBack,
-    result_key: SearchResult,
-    result_renderer: Callable[[dict[str, Any]], None],
-) -> None:
-    """Render a shared search form block.
+# Metadata keys holding the result source, in priority order
+_TEXT_SOURCE_KEYS = ("base_source", "url", "file_path")
+_MEDIA_SOURCE_KEYS = ("url", "file_path")
+_EMPTY_METADATA: dict[str, Any] = {}
 
-    Args:
-        title (str): Section title.
-        caption (str): Helper text displayed under the title.
-        input_func (Callable[[], Any]): Callable that renders the input widget.
-        button_label (str): Label for the search button.
-        button_callback (Callable[..., None]): Callback executed on submit.
-        button_args (Callable[[Any], tuple]): Callable that builds callback args.
-        feedback_key (FeedBack): Feedback state key.
-        result_key (SearchResult): Session key for the search result.
-        result_renderer (Callable[[dict[str, Any]], None]): Renderer for results.
-    """
-    st.subheader(title)
-    if caption:
-        st.caption(caption)
-
-    value = input_func()
-    st.button(
-        button_label,
-        on_click=button_callback,
-        args=button_args(value),
-    )
+# Errors raised for a source that cannot be loaded or played
+_MEDIA_ERRORS = (MediaFileStorageError, StreamlitAPIException, OSError, ValueError)
 
-    display_feedback(feedback_key)
-    result = st.session_state.get(result_key)
-    if result is not None:
-        result_renderer(result)
+# Modalities searched by the "all" mode; unavailable ones are skipped server-side
+_ALL_MODALITIES = ("text", "image", "audio", "video")
 
 
-def _render_search_view_text_text(client: RestAPIClient) -> None:
-    """Render the text-to-text search section.
+class _UnavailableSearchError(RuntimeError):
+    """Raised when the server cannot run a search kind in its current setting."""
 
-    Args:
-        client (RestAPIClient): REST API client.
-    """
-    mode = _get_text_retrieve_mode()
-    _render_search_section(
-        title="📝→📝 Search text with text",
-        caption='Find passages similar to the search query. Example: "employment rules summary"',
-        input_func=lambda: st.text_input("Search query", key="text_text_query"),
-        button_label="🔎 Search",
-        button_callback=run_text_text_search_callback,
-        button_args=lambda query: (
-            client,
-            query,
-            SearchResult.SR_SEARCH_TEXT_TEXT,
-            FeedBack.FB_SEARCH_TEXT_TEXT,
-            mode,
-        ),
-        feedback_key=FeedBack.FB_SEARCH_TEXT_TEXT,
-        result_key=SearchResult.SR_SEARCH_TEXT_TEXT,
-        result_renderer=lambda data: _render_query_results_text(
-            "📝 Search results", data
-        ),
-    )
 
+@dataclass(frozen=True, slots=True)
+class _SearchSpec:
+    """Declarative description of one search mode."""
 
-def _render_search_view_text_image(client: RestAPIClient) -> None:
-    """Render the text-to-image search section.
-
-    Args:
-        client (RestAPIClient): REST API client.
-    """
-    _render_search_section(
-        title="📝→🖼️ Search images with text",
-        caption='Find images similar to the search query. Example: "friends having a conversation"',
-        input_func=lambda: st.text_input("Search query", key="text_image_query"),
-        button_label="🔎 Search",
-        button_callback=run_text_image_search_callback,
-        button_args=lambda query: (
-            client,
-            query,
-            SearchResult.SR_SEARCH_TEXT_IMAGE,
-            FeedBack.FB_SEARCH_TEXT_IMAGE,
-        ),
-        feedback_key=FeedBack.FB_SEARCH_TEXT_IMAGE,
-        result_key=SearchResult.SR_SEARCH_TEXT_IMAGE,
-        result_renderer=lambda data: _render_query_results_image(
-            "🖼️ Search results", data
-        ),
-    )
+    label: str
+    title: str
+    caption: str
+    input_label: str
+    input_key: str
+    file_input: bool
+    callback: Callable[..., None]
+    result_key: SearchResult
+    feedback_key: FeedBack
+    renderer: Callable[[str, dict[str, Any]], None]
+    result_title: str
+    with_mode: bool = False
 
 
-def _render_search_view_image_image(client: RestAPIClient) -> None:
-    """Render the image-to-image search section.
+def _render_search_section(spec: _SearchSpec, client: RestAPIClient) -> None:
+    """Render a shared search form block.
 
     Args:
+        spec (_SearchSpec): Search mode to render.
         client (RestAPIClient): REST API client.
     """
-    _render_search_section(
-        title="🖼️→🖼️ Search images with an image",
-        caption="Upload an image to find similar images.",
-        input_func=lambda: st.file_uploader(
-            "Select an image to search", key="image_query_uploader"
-        ),
-        button_label="🔎 Search",
-        button_callback=run_image_image_search_callback,
-        button_args=lambda file_obj: (
-            client,
-            file_obj,
-            SearchResult.SR_SEARCH_IMAGE_IMAGE,
-            FeedBack.FB_SEARCH_IMAGE_IMAGE,
-        ),
-        feedback_key=FeedBack.FB_SEARCH_IMAGE_IMAGE,
-        result_key=SearchResult.SR_SEARCH_IMAGE_IMAGE,
-        result_renderer=lambda data: _render_query_results_image(
-            "🖼️ Search results", data
-        ),
-    )
+    st.subheader(spec.title)
+    if spec.caption:
+        st.caption(spec.caption)
 
+    widget = st.file_uploader if spec.file_input else st.text_input
+    value = widget(spec.input_label, key=spec.input_key)
 
-def _render_search_view_text_audio(client: RestAPIClient) -> None:
-    """Render the text-to-audio search section.
+    args: tuple[Any, ...] = (client, value, spec.result_key, spec.feedback_key)
+    if spec.with_mode:
+        args += (_get_text_retrieve_mode(),)
 
-    Args:
-        client (RestAPIClient): REST API client.
-    """
-    _render_search_section(
-        title="📝→🎤 Search audio with text",
-        caption='Find audio similar to the query. Example: "car horn"',
-        input_func=lambda: st.text_input("Search query", key="text_audio_query"),
-        button_label="🔎 Search",
-        button_callback=run_text_audio_search_callback,
-        button_args=lambda query: (
-            client,
-            query,
-            SearchResult.SR_SEARCH_TEXT_AUDIO,
-            FeedBack.FB_SEARCH_TEXT_AUDIO,
-        ),
-        feedback_key=FeedBack.FB_SEARCH_TEXT_AUDIO,
-        result_key=SearchResult.SR_SEARCH_TEXT_AUDIO,
-        result_renderer=lambda data: _render_query_results_audio(
-            "🎤 Search results", data
-        ),
-    )
+    st.button("🔎 Search", on_click=spec.callback, args=args)
+
+    display_feedback(spec.feedback_key)
+    result = st.session_state.get(spec.result_key)
+    if result is not None:
+        spec.renderer(spec.result_title, result)
 
 
-def _render_search_view_audio_audio(client: RestAPIClient) -> None:
-    """Render the audio-to-audio search section.
+@st.cache_data(ttl=_QUERY_TTL, show_spinner=False)
+def _cached_text_query(
+    base_url: str,
+    method: str,
+    query: str,
+    mode: Optional[str],
+    _client: RestAPIClient,
+) -> dict[str, Any]:
+    """Call a text query API, shared across reruns for _QUERY_TTL seconds.
 
     Args:
-        client (RestAPIClient): REST API client.
+        base_url (str): Server base URL, used as part of the cache key.
+        method (str): Name of the query method on RestAPIClient.
+        query (str): Query string.
+        mode (Optional[str]): Retrieve mode, only used by text->text search.
+        _client (RestAPIClient): REST API client (excluded from the cache key).
+
+    Returns:
+        dict[str, Any]: Response data.
     """
-    _render_search_section(
-        title="🎤→🎤 Search audio with audio",
-        caption="Upload audio to find similar clips.",
-        input_func=lambda: st.file_uploader(
-            "Select audio to search", key="audio_query_uploader"
-        ),
-        button_label="🔎 Search",
-        button_callback=run_audio_audio_search_callback,
-        button_args=lambda file_obj: (
-            client,
-            file_obj,
-            SearchResult.SR_SEARCH_AUDIO_AUDIO,
-            FeedBack.FB_SEARCH_AUDIO_AUDIO,
-        ),
-        feedback_key=FeedBack.FB_SEARCH_AUDIO_AUDIO,
-        result_key=SearchResult.SR_SEARCH_AUDIO_AUDIO,
-        result_renderer=lambda data: _render_query_results_audio(
-            "🎤 Search results", data
-        ),
-    )
+    if mode is None:
+        return getattr(_client, method)(query)
 
+    return getattr(_client, method)(query, mode=mode)
 
-def _render_search_view_text_video(client: RestAPIClient) -> None:
-    """Render the text-to-video search section.
+
+@st.cache_data(ttl=_QUERY_TTL, show_spinner=False)
+def _cached_text_multi_query(
+    base_url: str,
+    query: str,
+    mode: Optional[str],
+    _client: RestAPIClient,
+) -> dict[str, Any]:
+    """Search all modalities with one text query, shared across reruns.
 
     Args:
-        client (RestAPIClient): REST API client.
+        base_url (str): Server base URL, used as part of the cache key.
+        query (str): Query string.
+        mode (Optional[str]): Retrieve mode for the text modality.
+        _client (RestAPIClient): REST API client (excluded from the cache key).
+
+    Returns:
+        dict[str, Any]: Response data keyed by modality.
     """
-    _render_search_section(
-        title="📝→🎬 Search videos with text",
-        caption="Find videos similar to the query.",
-        input_func=lambda: st.text_input("Search query", key="text_video_query"),
-        button_label="🔎 Search",
-        button_callback=run_text_video_search_callback,
-        button_args=lambda query: (
-            client,
-            query,
-            SearchResult.SR_SEARCH_TEXT_VIDEO,
-            FeedBack.FB_SEARCH_TEXT_VIDEO,
-        ),
-        feedback_key=FeedBack.FB_SEARCH_TEXT_VIDEO,
-        result_key=SearchResult.SR_SEARCH_TEXT_VIDEO,
-        result_renderer=lambda data: _render_query_results_video(
-            "🎬 Search results", data
-        ),
-    )
+    return _client.query_text_multi(query, list(_ALL_MODALITIES), mode=mode)
 
 
-def _render_search_view_image_video(client: RestAPIClient) -> None:
-    """Render the image-to-video search section.
+@st.cache_data(ttl=_QUERY_TTL, show_spinner=False)
+def _cached_upload_query(
+    base_url: str,
+    kind: str,
+    upload_id: str,
+    _client: RestAPIClient,
+) -> dict[str, Any]:
+    """Search with an uploaded reference file, shared across reruns.
 
     Args:
-        client (RestAPIClient): REST API client.
-    """
-    _render_search_section(
-        title="🖼️→🎬 Search videos with an image",
-        caption="Upload an image to find similar videos.",
-        input_func=lambda: st.file_uploader(
-            "Select an image to search", key="image_video_query_uploader"
-        ),
-        button_label="🔎 Search",
-        button_callback=run_image_video_search_callback,
-        button_args=lambda file_obj: (
-            client,
-            file_obj,
-            SearchResult.SR_SEARCH_IMAGE_VIDEO,
-            FeedBack.FB_SEARCH_IMAGE_VIDEO,
-        ),
-        feedback_key=FeedBack.FB_SEARCH_IMAGE_VIDEO,
-        result_key=SearchResult.SR_SEARCH_IMAGE_VIDEO,
-        result_renderer=lambda data: _render_query_results_video(
-            "🎬 Search results", data
-        ),
-    )
-
+        base_url (str): Server base URL, used as part of the cache key.
+        kind (str): Query kind, named like the query APIs.
+        upload_id (str): Upload id of the reference file.
+        _client (RestAPIClient): REST API client (excluded from the cache key).
 
-def _render_search_view_audio_video(client: RestAPIClient) -> None:
-    """Render the audio-to-video search section.
+    Raises:
+        _UnavailableSearchError: If the server cannot run this kind of search.
 
-    Args:
-        client (RestAPIClient): REST API client.
+    Returns:
+        dict[str, Any]: Response data.
     """
-    _render_search_section(
-        title="🎤→🎬 Search videos with audio",
-        caption="Upload audio to find matching videos.",
-        input_func=lambda: st.file_uploader(
-            "Select audio to search", key="audio_video_query_uploader"
-        ),
-        button_label="🔎 Search",
-        button_callback=run_audio_video_search_callback,
-        button_args=lambda file_obj: (
-            client,
-            file_obj,
-            SearchResult.SR_SEARCH_AUDIO_VIDEO,
-            FeedBack.FB_SEARCH_AUDIO_VIDEO,
-        ),
-        feedback_key=FeedBack.FB_SEARCH_AUDIO_VIDEO,
-        result_key=SearchResult.SR_SEARCH_AUDIO_VIDEO,
-        result_renderer=lambda data: _render_query_results_video(
-            "🎬 Search results", data
-        ),
-    )
+    res = _client.query_batch([{"kind": kind, "upload_id": upload_id}])
+    result = res["results"][0]
 
+    # The batch API reports this per item where the upload API fails with 400;
+    # raising also keeps the empty result out of the cache
+    error = result.get("error")
+    if error:
+        raise _UnavailableSearchError(error)
 
-def _render_search_view_video_video(client: RestAPIClient) -> None:
-    """Render the video-to-video search section.
+    return result
 
-    Args:
-        client (RestAPIClient): REST API client.
-    """
-    _render_search_section(
-        title="🎬→🎬 Search videos with a video",
-        caption="Upload a reference video to find similar clips.",
-        input_func=lambda: st.file_uploader(
-            "Select a video to search", key="video_video_query_uploader"
-        ),
-        button_label="🔎 Search",
-        button_callback=run_video_video_search_callback,
-        button_args=lambda file_obj: (
-            client,
-            file_obj,
-            SearchResult.SR_SEARCH_VIDEO_VIDEO,
-            FeedBack.FB_SEARCH_VIDEO_VIDEO,
-        ),
-        feedback_key=FeedBack.FB_SEARCH_VIDEO_VIDEO,
-        result_key=SearchResult.SR_SEARCH_VIDEO_VIDEO,
-        result_renderer=lambda data: _render_query_results_video(
-            "🎬 Search results", data
-        ),
-    )
+
+def clear_search_caches() -> None:
+    """Drop cached search results."""
+    _cached_text_query.clear()
+    _cached_text_multi_query.clear()
+    _cached_upload_query.clear()
 
 
 def _run_text_search(
+    client: RestAPIClient,
     func: Callable[[str], dict[str, Any]],
     query: str,
     result_key: SearchResult,
@@ -333,12 +204,14 @@ def _run_text_search(
 ) -> None:
     """Execute a text-based search."""
 
+    # Callbacks run before the script body, so catch up on finished ingests here
+    sync_ingest_jobs(client)
     clear_feedback(feedback_key)
     clear_search_result(result_key)
 
     text = (query or "").strip()
     if not text:
-        set_feedback(feedback_key, "warning", "Enter a query.")
+        set_feedback(feedback_key, Category.WARNING, "Enter a query.")
         return
 
     try:
@@ -346,14 +219,57 @@ def _run_text_search(
             result = func(text)
     except Exception as e:
         logger.exception(e)
-        set_feedback(feedback_key, "error", f"Search failed: {e}")
+        set_feedback(feedback_key, Category.ERROR, f"Search failed: {e}")
     else:
         set_search_result(result_key, result)
-        set_feedback(feedback_key, "success", "Search completed.")
+        set_feedback(feedback_key, Category.SUCCESS, "Search completed.")
+
+
+def _query_file(
+    kind: Literal[
+        "image_image", "audio_audio", "image_video", "audio_video", "video_video"
+    ],
+    client: RestAPIClient,
+    file_obj: Any,
+) -> dict[str, Any]:
+    """Query with a reference file, uploading it only on first use.
+
+    Args:
+        kind (Literal[...]): Query kind, named like the query APIs.
+        client (RestAPIClient): REST API client.
+        file_obj (Any): Uploaded file object.
+
+    Returns:
+        dict[str, Any]: Response data.
+    """
+    known = known_upload_ids()
+    digest = upload_digest(file_obj)
+    upload_id = known.get(digest)
+    if upload_id is not None:
+        try:
+            return _cached_upload_query(client.base_url, kind, upload_id, client)
+        except _UnavailableSearchError:
+            raise
+        except Exception as e:
+            # Upload ids die with the server process, so upload again
+            logger.warning(f"reusing upload {upload_id} failed: {e}")
+            known.pop(digest, None)
+
+    # Upload and query in one round trip
+    res = client.query_with_upload(
+        kind, (file_obj.name, file_obj, getattr(file_obj, "type", None))
+    )
+    upload_id = res.get("upload_id")
+    if upload_id:
+        known[digest] = upload_id
+
+    return res
 
 
 def _run_file_search(
-    func: Callable[..., dict[str, Any]],
+    kind: Literal[
+        "image_image", "audio_audio", "image_video", "audio_video", "video_video"
+    ],
     client: RestAPIClient,
     file_obj: Any,
     result_key: SearchResult,
@@ -362,25 +278,27 @@ def _run_file_search(
     search_type: str,
 ) -> None:
     """Execute a file-based search."""
+    sync_ingest_jobs(client)
     clear_feedback(feedback_key)
     clear_search_result(result_key)
 
     if file_obj is None:
-        set_feedback(feedback_key, "warning", f"No {file_type} selected.")
+        set_feedback(feedback_key, Category.WARNING, f"No {file_type} selected.")
         return
 
     try:
         with st.spinner(f"Searching {search_type}..."):
-            upload_id = save_uploaded_files(client, [file_obj])[0]
-            result = func(upload_id=upload_id)
+            result = _query_file(kind, client, file_obj)
     except Exception as e:
         logger.exception(e)
         set_feedback(
-            feedback_key, "error", f"{search_type.capitalize()} search failed: {e}"
+            feedback_key,
+            Category.ERROR,
+            f"{search_type.capitalize()} search failed: {e}",
         )
     else:
         set_search_result(result_key, result)
-        set_feedback(feedback_key, "success", "Search completed.")
+        set_feedback(feedback_key, Category.SUCCESS, "Search completed.")
 
 
 def run_text_text_search_callback(
@@ -392,7 +310,10 @@ def run_text_text_search_callback(
 ) -> None:
     """Call the text-to-text search API."""
     _run_text_search(
-        func=lambda text: client.query_text_text(text, mode=mode),
+        client=client,
+        func=lambda text: _cached_text_query(
+            client.base_url, "query_text_text", text, mode, client
+        ),
         query=query,
         result_key=result_key,
         feedback_key=feedback_key,
@@ -407,7 +328,10 @@ def run_text_image_search_callback(
 ) -> None:
     """Call the text-to-image search API."""
     _run_text_search(
-        func=client.query_text_image,
+        client=client,
+        func=lambda text: _cached_text_query(
+            client.base_url, "query_text_image", text, None, client
+        ),
         query=query,
         result_key=result_key,
         feedback_key=feedback_key,
@@ -422,7 +346,7 @@ def run_image_image_search_callback(
 ) -> None:
     """Call the image-to-image search API."""
     _run_file_search(
-        func=client.query_image_image,
+        kind="image_image",
         client=client,
         file_obj=file_obj,
         result_key=result_key,
@@ -440,7 +364,10 @@ def run_text_audio_search_callback(
 ) -> None:
     """Call the text-to-audio search API."""
     _run_text_search(
-        func=client.query_text_audio,
+        client=client,
+        func=lambda text: _cached_text_query(
+            client.base_url, "query_text_audio", text, None, client
+        ),
         query=query,
         result_key=result_key,
         feedback_key=feedback_key,
@@ -455,7 +382,7 @@ def run_audio_audio_search_callback(
 ) -> None:
     """Call the audio-to-audio search API."""
     _run_file_search(
-        func=client.query_audio_audio,
+        kind="audio_audio",
         client=client,
         file_obj=file_obj,
         result_key=result_key,
@@ -473,7 +400,27 @@ def run_text_video_search_callback(
 ) -> None:
     """Call the text-to-video search API."""
     _run_text_search(
-        func=client.query_text_video,
+        client=client,
+        func=lambda text: _cached_text_query(
+            client.base_url, "query_text_video", text, None, client
+        ),
+        query=query,
+        result_key=result_key,
+        feedback_key=feedback_key,
+    )
+
+
+def run_text_all_search_callback(
+    client: RestAPIClient,
+    query: str,
+    result_key: SearchResult,
+    feedback_key: FeedBack,
+    mode: Optional[Literal["vector_only", "bm25_only", "fusion"]] = None,
+) -> None:
+    """Call the text-to-multi-modality search API."""
+    _run_text_search(
+        client=client,
+        func=lambda text: _cached_text_multi_query(client.base_url, text, mode, client),
         query=query,
         result_key=result_key,
         feedback_key=feedback_key,
@@ -488,7 +435,7 @@ def run_image_video_search_callback(
 ) -> None:
     """Call the image-to-video search API."""
     _run_file_search(
-        func=client.query_image_video,
+        kind="image_video",
         client=client,
         file_obj=file_obj,
         result_key=result_key,
@@ -506,7 +453,7 @@ def run_audio_video_search_callback(
 ) -> None:
     """Call the audio-to-video search API."""
     _run_file_search(
-        func=client.query_audio_video,
+        kind="audio_video",
         client=client,
         file_obj=file_obj,
         result_key=result_key,
@@ -524,7 +471,7 @@ def run_video_video_search_callback(
 ) -> None:
     """Call the video-to-video search API."""
     _run_file_search(
-        func=client.query_video_video,
+        kind="video_video",
         client=client,
         file_obj=file_obj,
         result_key=result_key,
@@ -534,118 +481,156 @@ def run_video_video_search_callback(
     )
 
 
+def _get_source(metadata: dict[str, Any], keys: tuple[str, ...]) -> str:
+    """Return the first non-empty source in the metadata.
+
+    Args:
+        metadata (dict[str, Any]): Document metadata.
+        keys (tuple[str, ...]): Source keys in priority order.
+
+    Returns:
+        str: Source, or an empty string when none is set.
+    """
+    return next((source for key in keys if (source := metadata.get(key))), "")
+
+
+@lru_cache(maxsize=4096)
+def _get_ext(uri: str) -> str:
+    """Get the extension of a result source without the dot, memoized per URI.
+
+    Args:
+        uri (str): File path or URL string.
+
+    Returns:
+        str: Extension string.
+    """
+    return Exts.get_ext(uri=uri, dot=False)
+
+
+def _source_markdown(source: str, metadata: dict[str, Any]) -> str:
+    """Build the source block shown under a media result.
+
+    Args:
+        source (str): Source of the media.
+        metadata (dict[str, Any]): Document metadata.
+
+    Returns:
+        str: Markdown text.
+    """
+    text = f"##### Source\n\n{source}"
+    base_source = metadata.get("base_source", "")
+    if base_source and source != base_source:
+        text += f"\n\nReference: {base_source}"
+
+    return text
+
+
 def _render_query_results_text(title: str, result: dict[str, Any]) -> None:
     """Render text search results."""
 
     st.subheader(title)
-    documents = result.get("documents") if isinstance(result, dict) else None
+    documents = result.get("documents")
     if not documents:
         st.info("No matching documents.")
         return
 
     for doc in documents:
-        metadata = doc.get("metadata", {})
-        content = doc.get("text", "")
-        source = (
-            metadata.get("base_source", "")
-            or metadata.get("url", "")
-            or metadata.get("file_path", "")
-        )  # Priority order
+        metadata = doc.get("metadata") or _EMPTY_METADATA
+        content = doc.get("text") or ""
+        source = _get_source(metadata, _TEXT_SOURCE_KEYS)
 
-        st.divider()
-        st.markdown("#### Content")
-        st.write(content)
-        st.markdown("##### Source")
-        st.write(source)
+        # One element per document instead of one per heading and body
+        st.markdown(f"---\n\n#### Content\n\n{content}\n\n##### Source\n\n{source}")
 
 
 def _render_query_results_image(title: str, result: dict[str, Any]) -> None:
     """Render image search results."""
     st.subheader(title)
-    documents = result.get("documents") if isinstance(result, dict) else None
+    documents = result.get("documents")
     if not documents:
         st.info("No matching images.")
         return
 
     for doc in documents:
-        metadata = doc.get("metadata", {})
-        source = metadata.get("url", "") or metadata.get(
-            "file_path", ""
-        )  # Priority order
+        metadata = doc.get("metadata") or _EMPTY_METADATA
+        source = _get_source(metadata, _MEDIA_SOURCE_KEYS)
 
         st.divider()
         try:
             st.image(source, width="content")
-        except Exception as e:
+        except _MEDIA_ERRORS as e:
             logger.warning(f"failed to render result image: {e}")
             st.warning("Unable to display the embedded file.")
 
-        st.markdown("##### Source")
-        st.write(source)
-
-        base_source = metadata.get("base_source", "")
-        if base_source and source != base_source:
-            st.write(f"Reference: {base_source}")
+        st.markdown(_source_markdown(source, metadata))
 
 
 def _render_query_results_audio(title: str, result: dict[str, Any]) -> None:
     """Render audio search results."""
     st.subheader(title)
-    documents = result.get("documents") if isinstance(result, dict) else None
+    documents = result.get("documents")
     if not documents:
         st.info("No matching audio.")
         return
 
     for doc in documents:
-        metadata = doc.get("metadata", {})
-        source = metadata.get("url", "") or metadata.get(
-            "file_path", ""
-        )  # Priority order
+        metadata = doc.get("metadata") or _EMPTY_METADATA
+        source = _get_source(metadata, _MEDIA_SOURCE_KEYS)
 
         st.divider()
         try:
-            ext = Exts.get_ext(uri=source, dot=False)
+            ext = _get_ext(source)
             st.audio(data=source, format=f"audio/{ext}")
-        except Exception as e:
+        except _MEDIA_ERRORS as e:
             logger.warning(f"failed to render result audio: {e}")
             st.warning("Unable to play the embedded file.")
 
-        st.markdown("##### Source")
-        st.write(source)
-
-        base_source = metadata.get("base_source", "")
-        if base_source and source != base_source:
-            st.write(f"Reference: {base_source}")
+        st.markdown(_source_markdown(source, metadata))
 
 
 def _render_query_results_video(title: str, result: dict[str, Any]) -> None:
     """Render video search results."""
 
     st.subheader(title)
-    documents = result.get("documents") if isinstance(result, dict) else None
+    documents = result.get("documents")
     if not documents:
         st.info("No matching videos.")
         return
 
     for doc in documents:
-        metadata = doc.get("metadata", {})
-        source = metadata.get("url", "") or metadata.get(
-            "file_path", ""
-        )  # Priority order
+        metadata = doc.get("metadata") or _EMPTY_METADATA
+        source = _get_source(metadata, _MEDIA_SOURCE_KEYS)
 
         st.divider()
         try:
             st.video(source)
-        except Exception as e:
+        except _MEDIA_ERRORS as e:
             logger.warning(f"failed to render result video: {e}")
             st.warning("Unable to play the embedded file.")
 
-        st.markdown("##### Source")
-        st.write(source)
+        st.markdown(_source_markdown(source, metadata))
+
+
+_RESULT_RENDERERS: dict[str, tuple[Callable[[str, dict[str, Any]], None], str]] = {
+    "text": (_render_query_results_text, "📝 Text results"),
+    "image": (_render_query_results_image, "🖼️ Image results"),
+    "audio": (_render_query_results_audio, "🎤 Audio results"),
+    "video": (_render_query_results_video, "🎬 Video results"),
+}
+
+
+def _render_query_results_all(title: str, result: dict[str, Any]) -> None:
+    """Render search results of several modalities."""
+    st.subheader(title)
+    if not result:
+        st.info("No matching documents.")
+        return
 
-        base_source = metadata.get("base_source", "")
-        if base_source and source != base_source:
-            st.write(f"Reference: {base_source}")
+    for modality, data in result.items():
+        entry = _RESULT_RENDERERS.get(modality)
+        if entry is not None:
+            renderer, modality_title = entry
+            renderer(modality_title, data)
 
 
 def _get_text_retrieve_mode() -> RetrieveMode:
@@ -687,6 +672,146 @@ def _render_text_mode_selector() -> None:
     )
 
 
+_SEARCH_SPECS: tuple[_SearchSpec, ...] = (
+    _SearchSpec(
+        label="Text 📝 → Text 📝",
+        title="📝→📝 Search text with text",
+        caption='Find passages similar to the search query. Example: "employment rules summary"',
+        input_label="Search query",
+        input_key="text_text_query",
+        file_input=False,
+        callback=run_text_text_search_callback,
+        result_key=SearchResult.SR_SEARCH_TEXT_TEXT,
+        feedback_key=FeedBack.FB_SEARCH_TEXT_TEXT,
+        renderer=_render_query_results_text,
+        result_title="📝 Search results",
+        with_mode=True,
+    ),
+    _SearchSpec(
+        label="Text 📝 → Image 🖼️",
+        title="📝→🖼️ Search images with text",
+        caption='Find images similar to the search query. Example: "friends having a conversation"',
+        input_label="Search query",
+        input_key="text_image_query",
+        file_input=False,
+        callback=run_text_image_search_callback,
+        result_key=SearchResult.SR_SEARCH_TEXT_IMAGE,
+        feedback_key=FeedBack.FB_SEARCH_TEXT_IMAGE,
+        renderer=_render_query_results_image,
+        result_title="🖼️ Search results",
+    ),
+    _SearchSpec(
+        label="Image 🖼️ → Image 🖼️",
+        title="🖼️→🖼️ Search images with an image",
+        caption="Upload an image to find similar images.",
+        input_label="Select an image to search",
+        input_key="image_query_uploader",
+        file_input=True,
+        callback=run_image_image_search_callback,
+        result_key=SearchResult.SR_SEARCH_IMAGE_IMAGE,
+        feedback_key=FeedBack.FB_SEARCH_IMAGE_IMAGE,
+        renderer=_render_query_results_image,
+        result_title="🖼️ Search results",
+    ),
+    _SearchSpec(
+        label="Text 📝 → Audio 🎤",
+        title="📝→🎤 Search audio with text",
+        caption='Find audio similar to the query. Example: "car horn"',
+        input_label="Search query",
+        input_key="text_audio_query",
+        file_input=False,
+        callback=run_text_audio_search_callback,
+        result_key=SearchResult.SR_SEARCH_TEXT_AUDIO,
+        feedback_key=FeedBack.FB_SEARCH_TEXT_AUDIO,
+        renderer=_render_query_results_audio,
+        result_title="🎤 Search results",
+    ),
+    _SearchSpec(
+        label="Audio 🎤 → Audio 🎤",
+        title="🎤→🎤 Search audio with audio",
+        caption="Upload audio to find similar clips.",
+        input_label="Select audio to search",
+        input_key="audio_query_uploader",
+        file_input=True,
+        callback=run_audio_audio_search_callback,
+        result_key=SearchResult.SR_SEARCH_AUDIO_AUDIO,
+        feedback_key=FeedBack.FB_SEARCH_AUDIO_AUDIO,
+        renderer=_render_query_results_audio,
+        result_title="🎤 Search results",
+    ),
+    _SearchSpec(
+        label="Text 📝 → Video 🎬",
+        title="📝→🎬 Search videos with text",
+        caption="Find videos similar to the query.",
+        input_label="Search query",
+        input_key="text_video_query",
+        file_input=False,
+        callback=run_text_video_search_callback,
+        result_key=SearchResult.SR_SEARCH_TEXT_VIDEO,
+        feedback_key=FeedBack.FB_SEARCH_TEXT_VIDEO,
+        renderer=_render_query_results_video,
+        result_title="🎬 Search results",
+    ),
+    _SearchSpec(
+        label="Image 🖼️ → Video 🎬",
+        title="🖼️→🎬 Search videos with an image",
+        caption="Upload an image to find similar videos.",
+        input_label="Select an image to search",
+        input_key="image_video_query_uploader",
+        file_input=True,
+        callback=run_image_video_search_callback,
+        result_key=SearchResult.SR_SEARCH_IMAGE_VIDEO,
+        feedback_key=FeedBack.FB_SEARCH_IMAGE_VIDEO,
+        renderer=_render_query_results_video,
+        result_title="🎬 Search results",
+    ),
+    _SearchSpec(
+        label="Audio 🎤 → Video 🎬",
+        title="🎤→🎬 Search videos with audio",
+        caption="Upload audio to find matching videos.",
+        input_label="Select audio to search",
+        input_key="audio_video_query_uploader",
+        file_input=True,
+        callback=run_audio_video_search_callback,
+        result_key=SearchResult.SR_SEARCH_AUDIO_VIDEO,
+        feedback_key=FeedBack.FB_SEARCH_AUDIO_VIDEO,
+        renderer=_render_query_results_video,
+        result_title="🎬 Search results",
+    ),
+    _SearchSpec(
+        label="Video 🎬 → Video 🎬",
+        title="🎬→🎬 Search videos with a video",
+        caption="Upload a reference video to find similar clips.",
+        input_label="Select a video to search",
+        input_key="video_video_query_uploader",
+        file_input=True,
+        callback=run_video_video_search_callback,
+        result_key=SearchResult.SR_SEARCH_VIDEO_VIDEO,
+        feedback_key=FeedBack.FB_SEARCH_VIDEO_VIDEO,
+        renderer=_render_query_results_video,
+        result_title="🎬 Search results",
+    ),
+    _SearchSpec(
+        label="Text 📝 → All 🔀",
+        title="📝→🔀 Search everything with text",
+        caption="Search text, images, audio and videos with one query.",
+        input_label="Search query",
+        input_key="text_all_query",
+        file_input=False,
+        callback=run_text_all_search_callback,
+        result_key=SearchResult.SR_SEARCH_TEXT_ALL,
+        feedback_key=FeedBack.FB_SEARCH_TEXT_ALL,
+        renderer=_render_query_results_all,
+        result_title="🔀 Search results",
+        with_mode=True,
+    ),
+)
+_SPEC_BY_LABEL: Mapping[str, _SearchSpec] = MappingProxyType(
+    {spec.label: spec for spec in _SEARCH_SPECS}
+)
+_SPEC_LABELS: tuple[str, ...] = tuple(_SPEC_BY_LABEL)
+
+
 def render_search_view(client: RestAPIClient) -> None:
     """Render the search view."""
 
@@ -694,22 +819,17 @@ def render_search_view(client: RestAPIClient) -> None:
     st.button("⬅️ Back to menu", key="search_back", on_click=set_view, args=(View.MAIN,))
     st.divider()
 
-    choice_map: dict[str, Callable[[RestAPIClient], None]] = {
-        "Text 📝 → Text 📝": _render_search_view_text_text,
-        "Text 📝 → Image 🖼️": _render_search_view_text_image,
-        "Image 🖼️ → Image 🖼️": _render_search_view_image_image,
-        "Text 📝 → Audio 🎤": _render_search_view_text_audio,
-        "Audio 🎤 → Audio 🎤": _render_search_view_audio_audio,
-        "Text 📝 → Video 🎬": _render_search_view_text_video,
-        "Image 🖼️ → Video 🎬": _render_search_view_image_video,
-        "Audio 🎤 → Video 🎬": _render_search_view_audio_video,
-        "Video 🎬 → Video 🎬": _render_search_view_video_video,
-    }
-    choice = st.sidebar.selectbox("Choose a search option.", list(choice_map.keys()))
-
-    renderer = choice_map.get(choice)
-    if renderer is not None:
-        if renderer is _render_search_view_text_text:
+    choice = st.sidebar.selectbox("Choose a search option.", _SPEC_LABELS)
+    st.sidebar.button(
+        "🔄 Refresh results",
+        key="search_refresh",
+        on_click=clear_search_caches,
+        help="Drop cached search results and query the server again.",
+    )
+
+    spec = _SPEC_BY_LABEL.get(choice)
+    if spec is not None:
+        if spec.with_mode:
             _render_text_mode_selector()
 
-        renderer(client)
+        _render_search_section(spec, client)
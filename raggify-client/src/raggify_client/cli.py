@@ -3,7 +3,8 @@ from __future__ import annotations
 import json
 import mimetypes
 import os
-from typing import TYPE_CHECKING, Any, Literal, Optional, Protocol
+from contextlib import ExitStack
+from typing import IO, TYPE_CHECKING, Any, Literal, Optional, Protocol
 
 import typer
 
@@ -175,23 +176,23 @@ def upload(
     if not paths:
         raise typer.BadParameter("paths must not be empty")
 
-    files: list[tuple[str, bytes, Optional[str]]] = []
-    for path in paths:
-        if not os.path.exists(path):
-            raise typer.BadParameter(f"file not found: {path}")
-
-        filename = os.path.basename(path)
-        if not filename:
-            raise typer.BadParameter(f"invalid file path: {path}")
-
-        with open(path, "rb") as handle:
-            data = handle.read()
-
-        content_type, _ = mimetypes.guess_type(path)
-        files.append((filename, data, content_type))
-
     parsed_kwargs = _parse_request_kwargs(request_kwargs)
-    _execute_client_command(lambda client: client.upload(files, **parsed_kwargs))
+    with ExitStack() as stack:
+        # Pass open handles so that file contents are not read into memory first
+        files: list[tuple[str, IO[bytes], Optional[str]]] = []
+        for path in paths:
+            if not os.path.exists(path):
+                raise typer.BadParameter(f"file not found: {path}")
+
+            filename = os.path.basename(path)
+            if not filename:
+                raise typer.BadParameter(f"invalid file path: {path}")
+
+            handle = stack.enter_context(open(path, "rb"))
+            content_type, _ = mimetypes.guess_type(path)
+            files.append((filename, handle, content_type))
+
+        _execute_client_command(lambda client: client.upload(files, **parsed_kwargs))
 
 
 @app.command(name="ip", help=f"(Not supported in client CLI)")
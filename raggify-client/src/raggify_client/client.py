@@ -1,12 +1,27 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Callable, Literal, Optional
+from typing import IO, Any, Callable, Literal, Optional, Sequence
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+try:
+    from requests_toolbelt import MultipartEncoder  # type: ignore
+except ImportError:
+    MultipartEncoder = None
 
 __all__ = ["RestAPIClient"]
 
+_POOL_CONNECTIONS = 8
+_POOL_MAXSIZE = 32
+
 
 class RestAPIClient:
     """Client for calling the server REST API."""
@@ -22,6 +37,45 @@ class RestAPIClient:
         """
         self._base_url = f"http://{host}:{port}/v1"
 
+        # Reuse pooled keep-alive connections instead of reconnecting per request
+        self._session = requests.Session()
+        self._session.headers.update({"Accept": "application/json"})
+
+        # Size the pool for the async variants, which run in worker threads.
+        # Retry only covers connection errors and idempotent methods, so a
+        # POST that reached the server is never replayed.
+        adapter = HTTPAdapter(
+            pool_connections=_POOL_CONNECTIONS,
+            pool_maxsize=_POOL_MAXSIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                raise_on_status=False,
+            ),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    @property
+    def base_url(self) -> str:
+        """Base URL of the server API.
+
+        Returns:
+            str: Base URL.
+        """
+        return self._base_url
+
+    def close(self) -> None:
+        """Close the pooled connections of the underlying session."""
+        self._session.close()
+
+    def __enter__(self) -> RestAPIClient:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     def _make_request(
         self, endpoint: str, func: Callable, timeout: int = 120, **kwargs
     ) -> dict[str, Any]:
@@ -29,7 +83,7 @@ class RestAPIClient:
 
         Args:
             endpoint (str): Endpoint path.
-            func (Callable): `requests.post` or `requests.get`.
+            func (Callable): `post` or `get` of the client session.
             timeout (int, optional): Timeout in seconds. Defaults to 120.
 
         Raises:
@@ -50,6 +104,10 @@ class RestAPIClient:
             raise RuntimeError(f"failed to call server endpoint: {detail}") from e
 
         try:
+            if orjson is not None:
+                # Parse the raw bytes directly, skipping the text decode
+                return orjson.loads(res.content)
+
             return res.json()
         except ValueError as e:
             raise RuntimeError(f"server response is not json: {e}") from e
@@ -68,7 +126,9 @@ class RestAPIClient:
             dict[str, Any]: JSON response.
         """
         params = kwargs if kwargs else None
-        return self._make_request(endpoint=endpoint, func=requests.get, params=params)
+        return self._make_request(
+            endpoint=endpoint, func=self._session.get, params=params
+        )
 
     async def aget_json(self, endpoint: str, **kwargs: Any) -> dict[str, Any]:
         """Send a GET request asynchronously and return the JSON response.
@@ -100,7 +160,7 @@ class RestAPIClient:
         """
         merged_payload = {**kwargs, **payload} if kwargs else payload
         return self._make_request(
-            endpoint=endpoint, func=requests.post, json=merged_payload
+            endpoint=endpoint, func=self._session.post, json=merged_payload
         )
 
     async def apost_json(
@@ -124,14 +184,18 @@ class RestAPIClient:
     def post_form_data_json(
         self,
         endpoint: str,
-        files: list[tuple[str, tuple[str, bytes, str]]],
+        files: list[tuple[str, tuple[str, bytes | IO[bytes], str]]],
         **kwargs: Any,
     ) -> dict[str, Any]:
         """Send a multipart/form-data POST and return the JSON response.
 
+        When requests-toolbelt is installed, the body is streamed from the file
+        objects in chunks; otherwise requests builds the whole body in memory.
+
         Args:
             endpoint (str): Relative path from base URL.
-            files (list[tuple[str, tuple[str, bytes, str]]]): File tuples for multipart upload.
+            files (list[tuple[str, tuple[str, bytes | IO[bytes], str]]]):
+                File tuples for multipart upload.
             **kwargs (Any): Extra query parameters.
 
         Raises:
@@ -141,21 +205,32 @@ class RestAPIClient:
             dict[str, Any]: JSON response.
         """
         params = kwargs if kwargs else None
+        if MultipartEncoder is None:
+            return self._make_request(
+                endpoint=endpoint, func=self._session.post, files=files, params=params
+            )
+
+        encoder = MultipartEncoder(fields=files)
         return self._make_request(
-            endpoint=endpoint, func=requests.post, files=files, params=params
+            endpoint=endpoint,
+            func=self._session.post,
+            data=encoder,
+            headers={"Content-Type": encoder.content_type},
+            params=params,
         )
 
     async def apost_form_data_json(
         self,
         endpoint: str,
-        files: list[tuple[str, tuple[str, bytes, str]]],
+        files: list[tuple[str, tuple[str, bytes | IO[bytes], str]]],
         **kwargs: Any,
     ) -> dict[str, Any]:
         """Send a multipart/form-data POST asynchronously and return the JSON response.
 
         Args:
             endpoint (str): Relative path from base URL.
-            files (list[tuple[str, tuple[str, bytes, str]]]): File tuples for multipart upload.
+            files (list[tuple[str, tuple[str, bytes | IO[bytes], str]]]):
+                File tuples for multipart upload.
             **kwargs (Any): Extra query parameters.
 
         Raises:
@@ -234,13 +309,43 @@ class RestAPIClient:
         """
         return await asyncio.to_thread(self.reload, config, **kwargs)
 
+    @staticmethod
+    def _file_part(
+        field: str, file: tuple[str, bytes | IO[bytes], Optional[str]]
+    ) -> tuple[str, tuple[str, bytes | IO[bytes], str]]:
+        """Validate a file tuple and build its multipart part.
+
+        Args:
+            field (str): Form field name.
+            file (tuple[str, bytes | IO[bytes], Optional[str]]): File name, data,
+                and content type.
+
+        Raises:
+            ValueError: If inputs are invalid.
+
+        Returns:
+            tuple[str, tuple[str, bytes | IO[bytes], str]]: Multipart part.
+        """
+        name, data, content_type = file
+        if not isinstance(name, str) or name == "":
+            raise ValueError("file name must be non-empty string")
+
+        if not isinstance(data, bytes) and not hasattr(data, "read"):
+            raise ValueError("file data must be bytes or a binary file object")
+
+        return (field, (name, data, content_type or "application/octet-stream"))
+
     def upload(
-        self, files: list[tuple[str, bytes, Optional[str]]], **kwargs: Any
+        self, files: list[tuple[str, bytes | IO[bytes], Optional[str]]], **kwargs: Any
     ) -> dict[str, Any]:
         """Call the file upload API.
 
+        File contents may be given as bytes or as a binary file object, which is
+        read by the HTTP layer instead of being copied into bytes up front.
+
         Args:
-            files (list[tuple[str, bytes, Optional[str]]]): Files to upload.
+            files (list[tuple[str, bytes | IO[bytes], Optional[str]]]):
+                Files to upload.
             **kwargs (Any): Extra query parameters.
 
         Returns:
@@ -253,26 +358,18 @@ class RestAPIClient:
         if not files:
             raise ValueError("files must not be empty")
 
-        files_payload: list[tuple[str, tuple[str, bytes, str]]] = []
-        for name, data, content_type in files:
-            if not isinstance(name, str) or name == "":
-                raise ValueError("file name must be non-empty string")
-
-            if not isinstance(data, bytes):
-                raise ValueError("file data must be bytes")
-
-            mime = content_type or "application/octet-stream"
-            files_payload.append(("files", (name, data, mime)))
+        files_payload = [self._file_part("files", file) for file in files]
 
         return self.post_form_data_json("/upload", files_payload, **kwargs)
 
     async def aupload(
-        self, files: list[tuple[str, bytes, Optional[str]]], **kwargs: Any
+        self, files: list[tuple[str, bytes | IO[bytes], Optional[str]]], **kwargs: Any
     ) -> dict[str, Any]:
         """Call the file upload API asynchronously.
 
         Args:
-            files (list[tuple[str, bytes, Optional[str]]]): Files to upload.
+            files (list[tuple[str, bytes | IO[bytes], Optional[str]]]):
+                Files to upload.
             **kwargs (Any): Extra query parameters.
 
         Raises:
@@ -283,6 +380,34 @@ class RestAPIClient:
         """
         return await asyncio.to_thread(self.upload, files, **kwargs)
 
+    def upload_status(self, upload_id: str, **kwargs: Any) -> dict[str, Any]:
+        """Call the upload status API.
+
+        Args:
+            upload_id (str): Upload ID.
+            **kwargs (Any): Extra query parameters.
+
+        Raises:
+            RuntimeError: If the request fails or JSON parsing fails.
+
+        Returns:
+            dict[str, Any]: Response data, whose exists tells whether the upload
+                is still registered on the server.
+        """
+        return self.get_json(f"/upload/{upload_id}", **kwargs)
+
+    async def aupload_status(self, upload_id: str, **kwargs: Any) -> dict[str, Any]:
+        """Call the upload status API asynchronously.
+
+        Args:
+            upload_id (str): Upload ID.
+            **kwargs (Any): Extra query parameters.
+
+        Returns:
+            dict[str, Any]: Response data.
+        """
+        return await asyncio.to_thread(self.upload_status, upload_id, **kwargs)
+
     def job(self, job_id: str = "", rm: bool = False, **kwargs: Any) -> dict[str, str]:
         """Call the background job API.
 
@@ -410,6 +535,71 @@ class RestAPIClient:
             self.ingest_path_list, path=path, force=force, **kwargs
         )
 
+    def ingest_paths(
+        self,
+        paths: Optional[Sequence[str]] = None,
+        upload_ids: Optional[Sequence[str]] = None,
+        force: bool = False,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Call the ingest-from-paths API to ingest several files in one job.
+
+        Args:
+            paths (Optional[Sequence[str]], optional): Paths on the server.
+                Defaults to None.
+            upload_ids (Optional[Sequence[str]], optional): Upload ids.
+                Defaults to None.
+            force (bool, optional): Force flag. Defaults to False.
+            **kwargs (Any): Extra JSON payload fields.
+
+        Raises:
+            RuntimeError: If the request fails or JSON parsing fails.
+
+        Returns:
+            dict[str, Any]: Response data.
+        """
+        payload: dict[str, Any] = {}
+        if paths:
+            payload["paths"] = list(paths)
+
+        if upload_ids:
+            payload["upload_ids"] = list(upload_ids)
+
+        payload["force"] = force
+
+        return self.post_json("/ingest/paths", payload, **kwargs)
+
+    async def aingest_paths(
+        self,
+        paths: Optional[Sequence[str]] = None,
+        upload_ids: Optional[Sequence[str]] = None,
+        force: bool = False,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Call the ingest-from-paths API asynchronously.
+
+        Args:
+            paths (Optional[Sequence[str]], optional): Paths on the server.
+                Defaults to None.
+            upload_ids (Optional[Sequence[str]], optional): Upload ids.
+                Defaults to None.
+            force (bool, optional): Force flag. Defaults to False.
+            **kwargs (Any): Extra JSON payload fields.
+
+        Raises:
+            RuntimeError: If the request fails or JSON parsing fails.
+
+        Returns:
+            dict[str, Any]: Response data.
+        """
+        return await asyncio.to_thread(
+            self.ingest_paths,
+            paths=paths,
+            upload_ids=upload_ids,
+            force=force,
+            **kwargs,
+        )
+
     def ingest_url(
         self, url: str, force: bool = False, **kwargs: Any
     ) -> dict[str, Any]:
@@ -589,6 +779,69 @@ class RestAPIClient:
             self.query_text_image, query, topk=topk, **kwargs
         )
 
+    def query_text_multi(
+        self,
+        query: str,
+        modalities: Sequence[Literal["text", "image", "audio", "video"]],
+        topk: Optional[int] = None,
+        mode: Optional[Literal["vector_only", "bm25_only", "fusion"]] = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Call the text->multi-modality search API in a single request.
+
+        Args:
+            query (str): Query string.
+            modalities (Sequence[Literal["text", "image", "audio", "video"]]):
+                Modalities to search.
+            topk (Optional[int], optional): Max count per modality. Defaults to None.
+            mode (Optional[Literal["vector_only", "bm25_only", "fusion"]], optional):
+                Retrieval mode for the text modality. Defaults to None.
+            **kwargs (Any): Extra JSON payload fields.
+
+        Raises:
+            RuntimeError: If the request fails or JSON parsing fails.
+
+        Returns:
+            dict[str, Any]: Response data keyed by modality.
+        """
+        payload: dict[str, Any] = {"query": query, "modalities": list(modalities)}
+        if topk is not None:
+            payload["topk"] = topk
+
+        if mode is not None:
+            payload["mode"] = mode
+
+        return self.post_json("/query/text_multi", payload, **kwargs)
+
+    async def aquery_text_multi(
+        self,
+        query: str,
+        modalities: Sequence[Literal["text", "image", "audio", "video"]],
+        topk: Optional[int] = None,
+        mode: Optional[Literal["vector_only", "bm25_only", "fusion"]] = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Call the text->multi-modality search API asynchronously.
+
+        Args:
+            query (str): Query string.
+            modalities (Sequence[Literal["text", "image", "audio", "video"]]):
+                Modalities to search.
+            topk (Optional[int], optional): Max count per modality. Defaults to None.
+            mode (Optional[Literal["vector_only", "bm25_only", "fusion"]], optional):
+                Retrieval mode for the text modality. Defaults to None.
+            **kwargs (Any): Extra JSON payload fields.
+
+        Raises:
+            RuntimeError: If the request fails or JSON parsing fails.
+
+        Returns:
+            dict[str, Any]: Response data keyed by modality.
+        """
+        return await asyncio.to_thread(
+            self.query_text_multi, query, modalities, topk=topk, mode=mode, **kwargs
+        )
+
     def query_image_image(
         self, path: Optional[str] = None, topk: Optional[int] = None, **kwargs: Any
     ) -> dict[str, Any]:
@@ -897,3 +1150,109 @@ class RestAPIClient:
         return await asyncio.to_thread(
             self.query_video_video, path, topk=topk, **kwargs
         )
+
+    def query_with_upload(
+        self,
+        kind: Literal[
+            "image_image", "audio_audio", "image_video", "audio_video", "video_video"
+        ],
+        file: tuple[str, bytes | IO[bytes], Optional[str]],
+        topk: Optional[int] = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Upload a query file and search with it in a single request.
+
+        Saves the round trip of calling upload before the query API.
+
+        Args:
+            kind (Literal[...]): Query kind, named like the query APIs.
+            file (tuple[str, bytes | IO[bytes], Optional[str]]): File name, data,
+                and content type.
+            topk (Optional[int], optional): Max count. Defaults to None.
+            **kwargs (Any): Extra query parameters.
+
+        Raises:
+            ValueError: If inputs are invalid.
+            RuntimeError: If the request fails or JSON parsing fails.
+
+        Returns:
+            dict[str, Any]: Response data including the upload id.
+        """
+        if topk is not None:
+            kwargs["topk"] = topk
+
+        return self.post_form_data_json(
+            f"/query/upload/{kind}", [self._file_part("file", file)], **kwargs
+        )
+
+    async def aquery_with_upload(
+        self,
+        kind: Literal[
+            "image_image", "audio_audio", "image_video", "audio_video", "video_video"
+        ],
+        file: tuple[str, bytes | IO[bytes], Optional[str]],
+        topk: Optional[int] = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Upload a query file and search with it in a single request asynchronously.
+
+        Args:
+            kind (Literal[...]): Query kind, named like the query APIs.
+            file (tuple[str, bytes | IO[bytes], Optional[str]]): File name, data,
+                and content type.
+            topk (Optional[int], optional): Max count. Defaults to None.
+            **kwargs (Any): Extra query parameters.
+
+        Raises:
+            ValueError: If inputs are invalid.
+            RuntimeError: If the request fails or JSON parsing fails.
+
+        Returns:
+            dict[str, Any]: Response data including the upload id.
+        """
+        return await asyncio.to_thread(
+            self.query_with_upload, kind, file, topk=topk, **kwargs
+        )
+
+    def query_batch(
+        self, items: Sequence[dict[str, Any]], **kwargs: Any
+    ) -> dict[str, Any]:
+        """Call the batch search API to run several searches in a single request.
+
+        Args:
+            items (Sequence[dict[str, Any]]): Searches to run. Each item has kind
+                (named like the query APIs, e.g. "text_image") and the fields of
+                that API (query, mode, path, upload_id, topk).
+            **kwargs (Any): Extra JSON payload fields.
+
+        Raises:
+            ValueError: If items is empty.
+            RuntimeError: If the request fails or JSON parsing fails.
+
+        Returns:
+            dict[str, Any]: Response data with results in the order of items.
+        """
+        if not items:
+            raise ValueError("items must not be empty")
+
+        return self.post_json("/query/batch", {"items": list(items)}, **kwargs)
+
+    async def aquery_batch(
+        self, items: Sequence[dict[str, Any]], **kwargs: Any
+    ) -> dict[str, Any]:
+        """Call the batch search API asynchronously.
+
+        Args:
+            items (Sequence[dict[str, Any]]): Searches to run. Each item has kind
+                (named like the query APIs, e.g. "text_image") and the fields of
+                that API (query, mode, path, upload_id, topk).
+            **kwargs (Any): Extra JSON payload fields.
+
+        Raises:
+            ValueError: If items is empty.
+            RuntimeError: If the request fails or JSON parsing fails.
+
+        Returns:
+            dict[str, Any]: Response data with results in the order of items.
+        """
+        return await asyncio.to_thread(self.query_batch, items, **kwargs)
@@ -162,8 +162,8 @@ class ClientCommand(Protocol):
 
 def _execute_client_command(command_func: ClientCommand, *args, **kwargs) -> None:
     try:
-        client = _create_rest_client()
-        result = command_func(client, *args, **kwargs)
+        with _create_rest_client() as client:
+            result = command_func(client, *args, **kwargs)
     except Exception as e:
         console.print(e)
         console.print(
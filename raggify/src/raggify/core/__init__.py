@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from .event import async_loop_runner
+from .event import AsyncLoopRunner, async_loop_runner
 from .exts import Exts
 from .metadata import BasicMetaData, MetaKeys, MetaKeysFrom
 
 __all__ = [
+    "AsyncLoopRunner",
     "async_loop_runner",
     "Exts",
     "MetaKeysFrom",
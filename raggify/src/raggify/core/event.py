@@ -2,18 +2,30 @@ from __future__ import annotations
 
 import asyncio
 import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Any, Callable, Coroutine, Optional, TypeVar
 
 T = TypeVar("T")
 
-__all__ = ["async_loop_runner"]
+__all__ = ["AsyncLoopRunner", "async_loop_runner"]
 
 
 class AsyncLoopRunner:
     """A helper class to run async coroutines in a separate event loop
     running in a background thread."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        loop_factory: Optional[Callable[[], asyncio.AbstractEventLoop]] = None,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            loop_factory (Optional[Callable[[], asyncio.AbstractEventLoop]], optional):
+                Factory for the background event loop, e.g. uvloop.new_event_loop.
+                Defaults to None (asyncio.new_event_loop).
+        """
+        self._loop_factory = loop_factory or asyncio.new_event_loop
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._thread: Optional[threading.Thread] = None
 
@@ -30,7 +42,7 @@ class AsyncLoopRunner:
             asyncio.set_event_loop(loop)
             loop.run_forever()
 
-        loop = asyncio.new_event_loop()
+        loop = self._loop_factory()
         thread = threading.Thread(target=_loop_worker, args=(loop,), daemon=True)
         thread.start()
 
@@ -39,12 +51,21 @@ class AsyncLoopRunner:
 
         return loop
 
-    def run(self, coro_factory: Callable[[], Coroutine[Any, Any, T]]) -> T:
+    def run(
+        self,
+        coro_factory: Callable[[], Coroutine[Any, Any, T]],
+        timeout: Optional[float] = None,
+    ) -> T:
         """Run a coroutine in the background event loop and wait for the result.
 
         Args:
             coro_factory (Callable[[], Coroutine[Any, Any, T]]):
                 A factory function that returns the coroutine to run.
+            timeout (Optional[float], optional): Seconds to wait for the result.
+                Defaults to None (wait forever).
+
+        Raises:
+            FutureTimeoutError: When the coroutine does not finish within timeout.
 
         Returns:
             T: The result of the coroutine.
@@ -52,7 +73,14 @@ class AsyncLoopRunner:
         loop = self._ensure_loop()
         future = asyncio.run_coroutine_threadsafe(coro_factory(), loop)
 
-        return future.result()
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError as e:
+            # Do not leave the coroutine occupying the shared loop
+            future.cancel()
+            raise FutureTimeoutError(
+                f"coroutine did not finish within {timeout}s"
+            ) from e
 
 
 async_loop_runner = AsyncLoopRunner()
@@ -152,6 +152,9 @@ async def aingest_path_list(
     if isinstance(lst, str):
         lst = _read_list(lst)
 
+    # Drop duplicates while keeping the order so that nothing is fetched twice
+    lst = list(dict.fromkeys(lst))
+
     rt = get_runtime()
     text_trees, text_leaves, images, audios, videos = (
         await rt.file_loader.aload_from_paths(
@@ -285,6 +288,9 @@ async def aingest_url_list(
     if isinstance(lst, str):
         lst = _read_list(lst)
 
+    # Drop duplicates while keeping the order so that nothing is fetched twice
+    lst = list(dict.fromkeys(lst))
+
     rt = get_runtime()
     text_trees, text_leaves, images, audios, videos = (
         await rt.web_page_loader.aload_from_urls(
@@ -3,8 +3,9 @@ from __future__ import annotations
 import asyncio
 import logging
 from contextlib import asynccontextmanager
+from functools import partial
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Literal, Optional
 
 import aiofiles
 from fastapi import FastAPI, File, HTTPException, UploadFile
@@ -41,18 +42,54 @@ class QueryTextTextRequest(BaseModel):
     mode: Optional[RetrieveMode] = None
 
 
+class QueryTextMultiRequest(BaseModel):
+    query: str
+    modalities: list[Modality]
+    topk: Optional[int] = None
+    mode: Optional[RetrieveMode] = None
+
+
 class QueryMultimodalRequest(BaseModel):
     path: Optional[str] = None
     upload_id: Optional[str] = None
     topk: Optional[int] = None
 
 
+class QueryBatchItem(BaseModel):
+    kind: Literal[
+        "text_text",
+        "text_image",
+        "text_audio",
+        "text_video",
+        "image_image",
+        "audio_audio",
+        "image_video",
+        "audio_video",
+        "video_video",
+    ]
+    query: Optional[str] = None
+    path: Optional[str] = None
+    upload_id: Optional[str] = None
+    topk: Optional[int] = None
+    mode: Optional[RetrieveMode] = None
+
+
+class QueryBatchRequest(BaseModel):
+    items: list[QueryBatchItem]
+
+
 class PathRequest(BaseModel):
     path: Optional[str] = None
     upload_id: Optional[str] = None
     force: bool = False
 
 
+class PathsRequest(BaseModel):
+    paths: list[str] = []
+    upload_ids: list[str] = []
+    force: bool = False
+
+
 class URLRequest(BaseModel):
     url: str
     force: bool = False
@@ -155,6 +192,68 @@ async def reload() -> dict[str, Any]:
     return {"status": "ok"}
 
 
+def _get_upload_dir() -> Path:
+    """Create the upload directory if needed and return it.
+
+    Raises:
+        HTTPException(500): When the directory cannot be created.
+
+    Returns:
+        Path: Absolute path to the upload directory.
+    """
+    try:
+        upload_dir = Path(get_runtime().cfg.ingest.upload_dir).absolute()
+        upload_dir.mkdir(parents=True, exist_ok=True)
+    except Exception as e:
+        msg = "mkdir failure"
+        logger.error(f"{msg}: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=msg)
+
+    return upload_dir
+
+
+async def _save_upload(f: UploadFile, upload_dir: Path) -> dict[str, Any]:
+    """Write an uploaded file to the upload directory and register it.
+
+    Args:
+        f (UploadFile): Uploaded file.
+        upload_dir (Path): Upload directory.
+
+    Raises:
+        HTTPException(500): When file creation fails.
+        HTTPException(400): When filename is missing.
+
+    Returns:
+        dict[str, Any]: File name, content type, and upload id.
+    """
+    if f.filename is None:
+        msg = "filename is not specified"
+        logger.error(msg)
+        raise HTTPException(status_code=400, detail=msg)
+
+    try:
+        safe = Path(f.filename).name
+        path = upload_dir / safe
+        async with aiofiles.open(path, "wb") as buf:
+            while True:
+                chunk = await f.read(1024 * 1024)
+                if not chunk:
+                    break
+                await buf.write(chunk)
+    except Exception as e:
+        msg = "write failure"
+        logger.error(f"{msg}: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=msg)
+    finally:
+        await f.close()
+
+    return {
+        "filename": safe,
+        "content_type": f.content_type,
+        "upload_id": await _register_upload(path),
+    }
+
+
 @app.post("/v1/upload", operation_id="upload")
 async def upload(files: list[UploadFile] = File(...)) -> dict[str, Any]:
     """Upload files from a client.
@@ -171,48 +270,35 @@ async def upload(files: list[UploadFile] = File(...)) -> dict[str, Any]:
     """
     logger.debug("exec /v1/upload")
 
-    try:
-        upload_dir = Path(get_runtime().cfg.ingest.upload_dir).absolute()
-        upload_dir.mkdir(parents=True, exist_ok=True)
-    except Exception as e:
-        msg = "mkdir failure"
-        logger.error(f"{msg}: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=msg)
-
+    upload_dir = _get_upload_dir()
     results = []
     for f in files:
-        if f.filename is None:
-            msg = "filename is not specified"
-            logger.error(msg)
-            raise HTTPException(status_code=400, detail=msg)
-
-        try:
-            safe = Path(f.filename).name
-            path = upload_dir / safe
-            async with aiofiles.open(path, "wb") as buf:
-                while True:
-                    chunk = await f.read(1024 * 1024)
-                    if not chunk:
-                        break
-                    await buf.write(chunk)
-        except Exception as e:
-            msg = "write failure"
-            logger.error(f"{msg}: {e}", exc_info=True)
-            raise HTTPException(status_code=500, detail=msg)
-        finally:
-            await f.close()
-
-        results.append(
-            {
-                "filename": safe,
-                "content_type": f.content_type,
-                "upload_id": await _register_upload(path),
-            }
-        )
+        results.append(await _save_upload(f=f, upload_dir=upload_dir))
 
     return {"files": results}
 
 
+@app.get("/v1/upload/{upload_id}", operation_id="upload_status")
+async def upload_status(upload_id: str) -> dict[str, Any]:
+    """Tell whether an upload id is still registered.
+
+    Upload ids live in server memory, so a client that keeps them across server
+    restarts can check them here before reusing them.
+
+    Args:
+        upload_id (str): Upload identifier.
+
+    Returns:
+        dict[str, Any]: Result.
+    """
+    logger.debug("exec /v1/upload/{upload_id}")
+
+    async with _request_lock:
+        exists = upload_id in _upload_map
+
+    return {"upload_id": upload_id, "exists": exists}
+
+
 async def _register_upload(path: Path) -> str:
     """Register an uploaded file path and return an upload id.
 
@@ -373,6 +459,40 @@ async def ingest_path_list(payload: PathRequest) -> dict[str, str]:
     return {"status": "accepted", "job_id": job.job_id}
 
 
+@app.post("/v1/ingest/paths", operation_id="ingest_paths")
+async def ingest_paths(payload: PathsRequest) -> dict[str, str]:
+    """Collect, embed, and store content from multiple paths in a single job.
+
+    Args:
+        payload (PathsRequest): Target paths and/or upload ids.
+
+    Raises:
+        HTTPException(400): When no path is given or an upload id is invalid.
+
+    Returns:
+        dict[str, str]: Result.
+    """
+    logger.debug("exec /v1/ingest/paths")
+
+    paths = list(payload.paths)
+    for upload_id in payload.upload_ids:
+        paths.append(await _resolve_upload_path(upload_id=upload_id, path=None))
+
+    if not paths:
+        msg = "paths is not specified"
+        logger.error(msg)
+        raise HTTPException(status_code=400, detail=msg)
+
+    job = get_worker().submit(
+        JobPayload(
+            kind="ingest_path_list",
+            kwargs={"lst": paths, "force": payload.force},
+        )
+    )
+
+    return {"status": "accepted", "job_id": job.job_id}
+
+
 @app.post("/v1/ingest/url", operation_id="ingest_url")
 async def ingest_url(payload: URLRequest) -> dict[str, str]:
     """Collect, embed, and store content from a URL.
@@ -421,6 +541,21 @@ async def ingest_url_list(payload: PathRequest) -> dict[str, str]:
     return {"status": "accepted", "job_id": job.job_id}
 
 
+def _ensure_modality_available(modality: Modality) -> None:
+    """Check that the embeddings of a modality are available.
+
+    Args:
+        modality (Modality): Modality.
+
+    Raises:
+        HTTPException(400): When the modality is not available.
+    """
+    if modality not in get_runtime().embed_manager.modality:
+        msg = f"{modality.value} embeddings is not available in current setting"
+        logger.error(msg)
+        raise HTTPException(status_code=400, detail=msg)
+
+
 async def _query_handler(
     modality: Modality, query_func: Callable, operation_name: str, **kwargs
 ) -> dict[str, Any]:
@@ -437,10 +572,7 @@ async def _query_handler(
     Returns:
         dict[str, Any]: Search results.
     """
-    if modality not in get_runtime().embed_manager.modality:
-        msg = f"{modality.value} embeddings is not available in current setting"
-        logger.error(msg)
-        raise HTTPException(status_code=400, detail=msg)
+    _ensure_modality_available(modality)
 
     async with _request_lock:
         try:
@@ -506,6 +638,67 @@ async def query_text_image(payload: QueryTextRequest) -> dict[str, Any]:
     )
 
 
+@app.post("/v1/query/text_multi", operation_id="query_text_multi")
+async def query_text_multi(payload: QueryTextMultiRequest) -> dict[str, Any]:
+    """Search documents of several modalities by one text query.
+
+    Args:
+        payload (QueryTextMultiRequest): Query content.
+
+    Raises:
+        HTTPException: When the search processing fails.
+
+    Returns:
+        dict[str, Any]: Search results keyed by modality.
+    """
+    from ..retrieve.retrieve import (
+        aquery_text_audio,
+        aquery_text_image,
+        aquery_text_text,
+        aquery_text_video,
+    )
+
+    logger.debug("exec /v1/query/text_multi")
+
+    query_funcs: dict[Modality, Callable] = {
+        Modality.TEXT: partial(aquery_text_text, mode=payload.mode),
+        Modality.IMAGE: aquery_text_image,
+        Modality.AUDIO: aquery_text_audio,
+        Modality.VIDEO: aquery_text_video,
+    }
+
+    available = get_runtime().embed_manager.modality
+    modalities = []
+    for modality in dict.fromkeys(payload.modalities):
+        if modality in available:
+            modalities.append(modality)
+        else:
+            logger.info(f"{modality.value} embeddings is not available, skipped")
+
+    if not modalities:
+        msg = "none of the requested embeddings is available in current setting"
+        logger.error(msg)
+        raise HTTPException(status_code=400, detail=msg)
+
+    async with _request_lock:
+        try:
+            # The lock serializes use of the shared retrievers, so run the
+            # modalities one by one rather than concurrently under it
+            results = [
+                await query_funcs[modality](query=payload.query, topk=payload.topk)
+                for modality in modalities
+            ]
+        except Exception as e:
+            msg = "query text multi failure"
+            logger.error(f"{msg}: {e}", exc_info=True)
+            raise HTTPException(status_code=500, detail=msg)
+
+    return {
+        modality.value: {"documents": _nodes_to_response(nodes)}
+        for modality, nodes in zip(modalities, results)
+    }
+
+
 @app.post("/v1/query/image_image", operation_id="query_image_image")
 async def query_image_image(payload: QueryMultimodalRequest) -> dict[str, Any]:
     """Search image documents by image query.
@@ -533,6 +726,167 @@ async def query_image_image(payload: QueryMultimodalRequest) -> dict[str, Any]:
     )
 
 
+@app.post("/v1/query/upload/{kind}", operation_id="query_upload")
+async def query_upload(
+    kind: str, file: UploadFile = File(...), topk: Optional[int] = None
+) -> dict[str, Any]:
+    """Upload a query file and search with it in a single request.
+
+    The file is registered like /v1/upload, so the returned upload id can be
+    reused with the other query endpoints.
+
+    Args:
+        kind (str): Query kind (image_image, audio_audio, image_video,
+            audio_video or video_video).
+        file (UploadFile, optional): Query file. Defaults to File(...).
+        topk (Optional[int], optional): Max count. Defaults to None.
+
+    Raises:
+        HTTPException(400): When the query kind is unknown or its embeddings are
+            not available.
+        HTTPException: When the upload or the search processing fails.
+
+    Returns:
+        dict[str, Any]: Upload id and search results.
+    """
+    from ..retrieve.retrieve import (
+        aquery_audio_audio,
+        aquery_audio_video,
+        aquery_image_image,
+        aquery_image_video,
+        aquery_video_video,
+    )
+
+    logger.debug(f"exec /v1/query/upload/{kind}")
+
+    query_funcs: dict[str, tuple[Modality, Callable]] = {
+        "image_image": (Modality.IMAGE, aquery_image_image),
+        "audio_audio": (Modality.AUDIO, aquery_audio_audio),
+        "image_video": (Modality.VIDEO, aquery_image_video),
+        "audio_video": (Modality.VIDEO, aquery_audio_video),
+        "video_video": (Modality.VIDEO, aquery_video_video),
+    }
+    entry = query_funcs.get(kind)
+    if entry is None:
+        msg = f"unknown query kind: {kind}"
+        logger.error(msg)
+        raise HTTPException(status_code=400, detail=msg)
+
+    modality, query_func = entry
+    # Check before saving so that a rejected request leaves no upload behind
+    _ensure_modality_available(modality)
+
+    saved = await _save_upload(f=file, upload_dir=_get_upload_dir())
+    path = await _resolve_upload_path(upload_id=saved["upload_id"], path=None)
+    res = await _query_handler(
+        modality=modality,
+        query_func=query_func,
+        operation_name=f"query {kind.replace('_', ' ')}",
+        path=path,
+        topk=topk,
+    )
+
+    return {"upload_id": saved["upload_id"], **res}
+
+
+@app.post("/v1/query/batch", operation_id="query_batch")
+async def query_batch(payload: QueryBatchRequest) -> dict[str, Any]:
+    """Run several searches of any kind in a single request.
+
+    Items whose embeddings are not available return no documents and an error
+    message instead of failing the whole batch, as query_text_multi skips such
+    modalities.
+
+    Args:
+        payload (QueryBatchRequest): Searches to run. Text kinds take query
+            (and mode for text_text); the others take path or upload_id.
+
+    Raises:
+        HTTPException(400): When an item is invalid.
+        HTTPException: When the search processing fails.
+
+    Returns:
+        dict[str, Any]: Search results in the order of the items.
+    """
+    from ..retrieve.retrieve import (
+        aquery_audio_audio,
+        aquery_audio_video,
+        aquery_image_image,
+        aquery_image_video,
+        aquery_text_audio,
+        aquery_text_image,
+        aquery_text_text,
+        aquery_text_video,
+        aquery_video_video,
+    )
+
+    logger.debug("exec /v1/query/batch")
+
+    query_funcs: dict[str, tuple[Modality, Callable]] = {
+        "text_text": (Modality.TEXT, aquery_text_text),
+        "text_image": (Modality.IMAGE, aquery_text_image),
+        "text_audio": (Modality.AUDIO, aquery_text_audio),
+        "text_video": (Modality.VIDEO, aquery_text_video),
+        "image_image": (Modality.IMAGE, aquery_image_image),
+        "audio_audio": (Modality.AUDIO, aquery_audio_audio),
+        "image_video": (Modality.VIDEO, aquery_image_video),
+        "audio_video": (Modality.VIDEO, aquery_audio_video),
+        "video_video": (Modality.VIDEO, aquery_video_video),
+    }
+
+    if not payload.items:
+        msg = "items is not specified"
+        logger.error(msg)
+        raise HTTPException(status_code=400, detail=msg)
+
+    available = get_runtime().embed_manager.modality
+    calls: list[Optional[Callable]] = []
+    errors: dict[int, str] = {}
+    for idx, item in enumerate(payload.items):
+        modality, query_func = query_funcs[item.kind]
+        if modality not in available:
+            msg = f"{modality.value} embeddings is not available in current setting"
+            logger.info(f"{msg}, {item.kind} skipped")
+            errors[idx] = msg
+            calls.append(None)
+            continue
+
+        if item.kind.startswith("text_"):
+            if not item.query:
+                msg = f"query is not specified for {item.kind}"
+                logger.error(msg)
+                raise HTTPException(status_code=400, detail=msg)
+
+            kwargs: dict[str, Any] = {"query": item.query, "topk": item.topk}
+            if item.kind == "text_text":
+                kwargs["mode"] = item.mode
+        else:
+            path = await _resolve_upload_path(upload_id=item.upload_id, path=item.path)
+            kwargs = {"path": path, "topk": item.topk}
+
+        calls.append(partial(query_func, **kwargs))
+
+    async with _request_lock:
+        try:
+            # Serialized like the single-query endpoints, see query_text_multi
+            results = [None if call is None else await call() for call in calls]
+        except Exception as e:
+            msg = "query batch failure"
+            logger.error(f"{msg}: {e}", exc_info=True)
+            raise HTTPException(status_code=500, detail=msg)
+
+    return {
+        "results": [
+            (
+                {"documents": [], "error": errors[idx]}
+                if nodes is None
+                else {"documents": _nodes_to_response(nodes)}
+            )
+            for idx, nodes in enumerate(results)
+        ]
+    }
+
+
 @app.post("/v1/query/text_audio", operation_id="query_text_audio")
 async def query_text_audio(payload: QueryTextRequest) -> dict[str, Any]:
     """Search audio documents by text query.
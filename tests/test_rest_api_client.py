@@ -10,3 +10,8 @@ configure_test_env()
 def test_client_smoke():
     for call in mock.CLIENT_CALLS:
         call()
+
+
+def test_client_context_manager():
+    with mock.RestClientStub() as client:
+        assert client.status() == {"status": "ok"}
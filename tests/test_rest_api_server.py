@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 import importlib
 from pathlib import Path
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
+from raggify.llama_like.core.schema import Modality
 from tests.utils.mock_rest_api_server import patch_rest_api_server
 
 from .config import configure_test_env
@@ -54,6 +57,13 @@ def test_upload_endpoint(api_client, tmp_path):
     upload_id = payload["files"][0]["upload_id"]
     assert upload_id != ""
 
+    status = client.get(f"/v1/upload/{upload_id}")
+    assert status.status_code == 200
+    assert status.json() == {"upload_id": upload_id, "exists": True}
+
+    unknown = client.get("/v1/upload/unknown")
+    assert unknown.json()["exists"] is False
+
 
 def test_ingest_and_job_routes(api_client):
     client, _ = api_client
@@ -61,6 +71,7 @@ def test_ingest_and_job_routes(api_client):
     ingest_requests = [
         ("/v1/ingest/path", {"path": "/tmp/a.txt"}),
         ("/v1/ingest/path_list", {"path": "/tmp/list.txt"}),
+        ("/v1/ingest/paths", {"paths": ["/tmp/a.txt", "/tmp/b.txt"]}),
         ("/v1/ingest/url", {"url": "https://some.site.com"}),
         ("/v1/ingest/url_list", {"path": "/tmp/urls.txt"}),
     ]
@@ -110,3 +121,122 @@ def test_query_endpoints(api_client, endpoint, payload):
     assert resp.status_code == 200
     body = resp.json()
     assert len(body["documents"]) == 2
+
+
+def test_query_text_multi_endpoint(api_client):
+    client, _ = api_client
+
+    resp = client.post(
+        "/v1/query/text_multi",
+        json={"query": "hello", "modalities": ["text", "image", "text"]},
+    )
+    assert resp.status_code == 200
+    body = resp.json()
+    assert list(body) == ["text", "image"]
+    assert len(body["image"]["documents"]) == 2
+
+
+def test_query_multi_endpoints_run_serially(api_client):
+    client, _ = api_client
+    active = {"now": 0, "max": 0}
+
+    async def _tracked(**kwargs):
+        active["now"] += 1
+        active["max"] = max(active["max"], active["now"])
+        await asyncio.sleep(0.01)
+        active["now"] -= 1
+        return []
+
+    targets = ("aquery_text_text", "aquery_text_image", "aquery_image_image")
+    patches = [
+        patch(f"raggify.retrieve.retrieve.{name}", AsyncMock(side_effect=_tracked))
+        for name in targets
+    ]
+    for p in patches:
+        p.start()
+    try:
+        multi = client.post(
+            "/v1/query/text_multi",
+            json={"query": "hello", "modalities": ["text", "image"]},
+        )
+        batch = client.post(
+            "/v1/query/batch",
+            json={
+                "items": [
+                    {"kind": "text_text", "query": "hello"},
+                    {"kind": "image_image", "path": "/tmp/image.png"},
+                ]
+            },
+        )
+    finally:
+        for p in patches:
+            p.stop()
+
+    assert multi.status_code == 200
+    assert batch.status_code == 200
+    assert active["max"] == 1
+
+
+def test_query_upload_endpoint(api_client):
+    client, _ = api_client
+
+    files = [("file", ("query.png", b"hello", "image/png"))]
+    resp = client.post("/v1/query/upload/image_image", files=files)
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["upload_id"] != ""
+    assert len(body["documents"]) == 2
+
+    unknown = client.post("/v1/query/upload/text_text", files=files)
+    assert unknown.status_code == 400
+
+
+def test_query_upload_unavailable_modality_keeps_no_upload(api_client, tmp_path):
+    client, ctx = api_client
+    ctx.runtime.embed_manager.modality = {Modality.TEXT}
+
+    files = [("file", ("query.png", b"hello", "image/png"))]
+    resp = client.post("/v1/query/upload/image_image", files=files)
+    assert resp.status_code == 400
+    assert not any(p.is_file() for p in tmp_path.rglob("*"))
+
+
+def test_query_batch_endpoint(api_client):
+    client, _ = api_client
+
+    resp = client.post(
+        "/v1/query/batch",
+        json={
+            "items": [
+                {"kind": "text_text", "query": "hello", "mode": "fusion"},
+                {"kind": "image_video", "path": "/tmp/image.png"},
+            ]
+        },
+    )
+    assert resp.status_code == 200
+    results = resp.json()["results"]
+    assert len(results) == 2
+    assert len(results[1]["documents"]) == 2
+
+    missing = client.post("/v1/query/batch", json={"items": [{"kind": "text_image"}]})
+    assert missing.status_code == 400
+
+
+def test_query_batch_skips_unavailable_modality(api_client):
+    client, ctx = api_client
+    ctx.runtime.embed_manager.modality = {Modality.TEXT, Modality.IMAGE}
+
+    resp = client.post(
+        "/v1/query/batch",
+        json={
+            "items": [
+                {"kind": "image_image", "path": "/tmp/image.png"},
+                {"kind": "image_video", "path": "/tmp/image.png"},
+            ]
+        },
+    )
+    assert resp.status_code == 200
+    results = resp.json()["results"]
+    assert len(results[0]["documents"]) == 2
+    assert results[1]["documents"] == []
+    assert "video" in results[1]["error"]
@@ -28,6 +28,10 @@ def upload_client() -> dict[str, str]:
     return client_stub.upload([("file.bin", b"hello", None)])
 
 
+def upload_status_client() -> dict[str, str]:
+    return client_stub.upload_status("abc")
+
+
 def job_client() -> dict[str, str]:
     return client_stub.job()
 
@@ -40,6 +44,10 @@ def ingest_path_list_client() -> dict[str, str]:
     return client_stub.ingest_path_list("/tmp/list.txt")
 
 
+def ingest_paths_client() -> dict[str, str]:
+    return client_stub.ingest_paths(["/tmp/a.txt", "/tmp/b.txt"])
+
+
 def ingest_url_client() -> dict[str, str]:
     return client_stub.ingest_url("https://some.site.com")
 
@@ -56,6 +64,10 @@ def query_text_image_client() -> dict[str, str]:
     return client_stub.query_text_image("hello")
 
 
+def query_text_multi_client() -> dict[str, str]:
+    return client_stub.query_text_multi("hello", ["text", "image"])
+
+
 def query_image_image_client() -> dict[str, str]:
     return client_stub.query_image_image("/tmp/image.png")
 
@@ -84,17 +96,35 @@ def query_video_video_client() -> dict[str, str]:
     return client_stub.query_video_video("/tmp/video.mp4")
 
 
+def query_with_upload_client() -> dict[str, str]:
+    return client_stub.query_with_upload(
+        "image_image", ("image.png", b"hello", "image/png")
+    )
+
+
+def query_batch_client() -> dict[str, str]:
+    return client_stub.query_batch(
+        [
+            {"kind": "text_image", "query": "hello"},
+            {"kind": "image_image", "path": "/tmp/image.png"},
+        ]
+    )
+
+
 CLIENT_CALLS = [
     status_client,
     reload_client,
     upload_client,
+    upload_status_client,
     job_client,
     ingest_path_client,
     ingest_path_list_client,
+    ingest_paths_client,
     ingest_url_client,
     ingest_url_list_client,
     query_text_text_client,
     query_text_image_client,
+    query_text_multi_client,
     query_image_image_client,
     query_text_audio_client,
     query_audio_audio_client,
@@ -102,4 +132,6 @@ CLIENT_CALLS = [
     query_image_video_client,
     query_audio_video_client,
     query_video_video_client,
+    query_with_upload_client,
+    query_batch_client,
 ]